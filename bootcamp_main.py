@@ -4,8 +4,9 @@ Bootcamp F2025
 Main process to setup and manage all the other working processes
 """
 
+import gc
 import multiprocessing as mp
-import queue
+import sys
 import time
 
 from pymavlink import mavutil
@@ -13,12 +14,16 @@ from pymavlink import mavutil
 from modules.common.modules.logger import logger
 from modules.common.modules.logger import logger_main_setup
 from modules.common.modules.read_yaml import read_yaml
+from modules.combined import combined_worker
 from modules.command import command
 from modules.command import command_worker
 from modules.heartbeat import heartbeat_receiver_worker
 from modules.heartbeat import heartbeat_sender_worker
+from modules.telemetry import telemetry
 from modules.telemetry import telemetry_worker
+from utilities import queued_logging
 from utilities.workers import queue_proxy_wrapper
+from utilities.workers import spsc_ring_buffer
 from utilities.workers import worker_controller
 from utilities.workers import worker_manager
 
@@ -48,6 +53,19 @@ HEARTBEAT_PERIOD = 1.0
 # Any other constants
 TARGET = command.Position(10, 10, 10)
 
+# How long main runs for before stopping the workers
+MAIN_PROCESS_RUN_TIME = 100  # seconds
+
+# Run the heartbeat, telemetry and command work in one process instead of one process each
+USE_COMBINED_WORKER = False
+
+# Maximum number of messages main takes from a queue at once
+MAIN_QUEUE_BATCH_SIZE = 100
+
+# Maximum time to wait for workers to finish after requesting exit
+WORKER_EXIT_TIMEOUT = 5.0  # seconds
+
+
 # =================================================================================================
 #                            ↑ BOOTCAMPERS MODIFY ABOVE THIS COMMENT ↑
 # =================================================================================================
@@ -89,132 +107,250 @@ def main() -> int:
     # Create a worker controller
     main_controller = worker_controller.WorkerController()
 
-    # Create a multiprocess manager for synchronized queues
-    manager = mp.Manager()
-
     # Create queues
-    receiver_queue = queue_proxy_wrapper.QueueProxyWrapper(manager, TELEMETRY_QUEUE_MAXSIZE)
-    telemetry_queue = queue_proxy_wrapper.QueueProxyWrapper(manager, TELEMETRY_QUEUE_MAXSIZE)
-    command_queue = queue_proxy_wrapper.QueueProxyWrapper(manager, COMMAND_QUEUE_MAXSIZE)
-
-    # Create worker properties for each worker type (what inputs it takes, how many workers)
-    # Heartbeat sender
-    result, hb_send_props = worker_manager.WorkerProperties.create(
-        count=NUM_HEARTBEAT_SENDERS,
-        target=heartbeat_sender_worker.heartbeat_sender_worker,
-        work_arguments=(connection, HEARTBEAT_PERIOD),
-        input_queues=[],
-        output_queues=[],
-        controller=main_controller,
-        local_logger=main_logger,
-    )
-    if not result:
-        main_logger.error("Sender worker failed")
-        return -1
-
-    # Heartbeat receiver
-    result, heartbeat_receiver_worker_prop = worker_manager.WorkerProperties.create(
-        target=heartbeat_receiver_worker.heartbeat_receiver_worker,
-        count=NUM_HEARTBEAT_RECEIVER,
-        work_arguments=(connection,),
-        input_queues=[],
-        output_queues=[receiver_queue],
-        controller=main_controller,
-        local_logger=main_logger,
-    )
-    if not result:
-        main_logger.error("Receiver worker failed")
-        return -1
-
-    # Telemetry
-    result, telemetry_worker_prop = worker_manager.WorkerProperties.create(
-        target=telemetry_worker.telemetry_worker,
-        count=NUM_TELEMETRY,
-        work_arguments=(connection,),
-        input_queues=[],
-        output_queues=[telemetry_queue],
-        controller=main_controller,
-        local_logger=main_logger,
-    )
-    if not result:
-        main_logger.error("Telemetry worker failed")
-        return -1
-
-    # Command
-    result, command_worker_prop = worker_manager.WorkerProperties.create(
-        target=command_worker.command_worker,
-        count=NUM_COMMAND,
-        work_arguments=(connection, TARGET),
-        input_queues=[telemetry_queue],
-        output_queues=[command_queue],
-        controller=main_controller,
-        local_logger=main_logger,
-    )
-    if not result:
-        main_logger.error("Command worker failed")
-        return -1
-
-    assert hb_send_props is not None
-    assert heartbeat_receiver_worker_prop is not None
-    assert telemetry_worker_prop is not None
-    assert command_worker_prop is not None
-
-    # Create the workers (processes) and obtain their managers
-    all_worker_properties_list = [
-        hb_send_props,
-        heartbeat_receiver_worker_prop,
-        telemetry_worker_prop,
-        command_worker_prop,
-    ]
-
-    result, main_worker_manager = worker_manager.WorkerManager.create(
-        worker_properties=all_worker_properties_list,
-        local_logger=main_logger,
-    )
-
-    if not result:
-        return -1
-    assert main_worker_manager is not None
-
-    # Start worker processes
-    main_worker_manager.start_workers()
-    main_logger.info("Started workers")
-
-    # Main's work: read from all queues that output to main, and log any commands that we make
-    # Continue running for 100 seconds or until the drone disconnects
-    start_time = time.time()
-    queues = [receiver_queue, telemetry_queue, command_queue]
-
-    while time.time() - start_time < 100 and connection.target_system != 0:
-        for output in queues:
-            try:
-                msg = output.queue.get_nowait()
-                main_logger.info(f"Received message: {msg}")
-
-                if msg == "Disconnected":
+    # Plain multiprocessing queues, no manager server process in between
+    receiver_queue = queue_proxy_wrapper.QueueProxyWrapper(maxsize=HEARTBEAT_RECEIVER_QUEUE_SIZE)
+    command_queue = queue_proxy_wrapper.QueueProxyWrapper(maxsize=COMMAND_QUEUE_MAXSIZE)
+
+    # Each worker type's properties and whether main restarts its workers as they exit
+    all_worker_properties: list[tuple[worker_manager.WorkerProperties, bool]] = []
+    telemetry_ring_buffer = None
+    is_restart_failed = False
+    # Shared memory outlives the process unless it is unlinked
+    try:
+        if USE_COMBINED_WORKER:
+            # One process for the heartbeats, telemetry and commands, only main's queues are used
+            result, combined_worker_prop = worker_manager.WorkerProperties.create(
+                target=combined_worker.combined_worker,
+                count=1,
+                work_arguments=(connection, TARGET, HEARTBEAT_PERIOD),
+                input_queues=[],
+                output_queues=[receiver_queue, command_queue],
+                controller=main_controller,
+                local_logger=main_logger,
+            )
+            if not result:
+                main_logger.error("Combined worker failed")
+                return -1
+
+            assert combined_worker_prop is not None
+
+            all_worker_properties.append((combined_worker_prop, False))
+            receiver_worker_count = 1
+            command_worker_count = 1
+        else:
+            # Telemetry records go to the command worker through a shared memory ring buffer
+            if NUM_COMMAND != 1:
+                main_logger.error("Telemetry to command ring buffer needs exactly 1 command worker")
+                return -1
+
+            result, telemetry_ring_buffer = spsc_ring_buffer.SpscRingBuffer.create(
+                TELEMETRY_QUEUE_MAXSIZE,
+                telemetry.TelemetryData.RECORD_SIZE,
+            )
+            if not result:
+                main_logger.error("Failed to create telemetry ring buffer")
+                return -1
+
+            # Get Pylance to stop complaining
+            assert telemetry_ring_buffer is not None
+
+            if NUM_TELEMETRY == 1:
+                telemetry_ring_queue = spsc_ring_buffer.SpscQueue(telemetry_ring_buffer)
+            else:
+                telemetry_ring_queue = spsc_ring_buffer.MpscQueue(telemetry_ring_buffer)
+
+            telemetry_queue = queue_proxy_wrapper.QueueProxyWrapper(
+                TELEMETRY_QUEUE_MAXSIZE,
+                telemetry_ring_queue,
+            )
+
+            # Create worker properties for each worker type (what inputs it takes, how many workers)
+            # Heartbeat sender
+            result, hb_send_props = worker_manager.WorkerProperties.create(
+                count=NUM_HEARTBEAT_SENDERS,
+                target=heartbeat_sender_worker.heartbeat_sender_worker,
+                work_arguments=(connection,),
+                input_queues=[],
+                output_queues=[],
+                controller=main_controller,
+                local_logger=main_logger,
+            )
+            if not result:
+                main_logger.error("Sender worker failed")
+                return -1
+
+            # Heartbeat receiver
+            result, heartbeat_receiver_worker_prop = worker_manager.WorkerProperties.create(
+                target=heartbeat_receiver_worker.heartbeat_receiver_worker,
+                count=NUM_HEARTBEAT_RECEIVER,
+                work_arguments=(connection,),
+                input_queues=[],
+                output_queues=[receiver_queue],
+                controller=main_controller,
+                local_logger=main_logger,
+            )
+            if not result:
+                main_logger.error("Receiver worker failed")
+                return -1
+
+            # Telemetry
+            result, telemetry_worker_prop = worker_manager.WorkerProperties.create(
+                target=telemetry_worker.telemetry_worker,
+                count=NUM_TELEMETRY,
+                work_arguments=(connection,),
+                input_queues=[],
+                output_queues=[telemetry_queue],
+                controller=main_controller,
+                local_logger=main_logger,
+            )
+            if not result:
+                main_logger.error("Telemetry worker failed")
+                return -1
+
+            # Command
+            result, command_worker_prop = worker_manager.WorkerProperties.create(
+                target=command_worker.command_worker,
+                count=NUM_COMMAND,
+                work_arguments=(connection, TARGET, NUM_TELEMETRY),
+                input_queues=[telemetry_queue],
+                output_queues=[command_queue],
+                controller=main_controller,
+                local_logger=main_logger,
+            )
+            if not result:
+                main_logger.error("Command worker failed")
+                return -1
+
+            assert hb_send_props is not None
+            assert heartbeat_receiver_worker_prop is not None
+            assert telemetry_worker_prop is not None
+            assert command_worker_prop is not None
+
+            all_worker_properties.extend(
+                [
+                    (hb_send_props, True),
+                    (heartbeat_receiver_worker_prop, False),
+                    (telemetry_worker_prop, False),
+                    (command_worker_prop, False),
+                ]
+            )
+            receiver_worker_count = NUM_HEARTBEAT_RECEIVER
+            command_worker_count = NUM_COMMAND
+
+        # Create the workers (processes) and obtain their managers
+        worker_managers: list[worker_manager.WorkerManager] = []  # List of all worker managers
+        recycled_worker_managers: list[worker_manager.WorkerManager] = []
+        for worker_properties, is_recycled in all_worker_properties:
+            result, manager = worker_manager.WorkerManager.create(
+                worker_properties=worker_properties,
+                local_logger=main_logger,
+            )
+            if not result:
+                main_logger.error(
+                    f"Failed to create manager for {worker_properties.get_target_name()}"
+                )
+                return -1
+
+            # Get Pylance to stop complaining
+            assert manager is not None
+
+            worker_managers.append(manager)
+            if is_recycled:
+                recycled_worker_managers.append(manager)
+
+        # Keep the garbage collector from unsharing pages inherited by forked workers
+        if mp.get_start_method() == "fork":
+            gc.collect()
+            gc.freeze()
+
+        # Start worker processes
+        for manager in worker_managers:
+            manager.start_workers()
+
+        # Log file writes on a background thread, started after forking the workers
+        log_listener = queued_logging.start_queued_logging(main_logger)
+        main_logger.info("Started workers")
+
+        # Main's work: read from all queues that output to main, and log any commands that we make
+        # Continue running for MAIN_PROCESS_RUN_TIME or until the drone disconnects
+        # Monotonic integer nanoseconds, immune to wall clock jumps
+        deadline_ns = time.monotonic_ns() + MAIN_PROCESS_RUN_TIME * 1_000_000_000
+        # The telemetry queue is consumed by the command worker
+        queues = [receiver_queue, command_queue]
+        log_info = main_logger.info
+
+        while connection.target_system != 0:
+            remaining_ns = deadline_ns - time.monotonic_ns()
+            if remaining_ns <= 0:
+                break
+
+            # Sleep until a worker sends something, or until recycled workers need checking
+            wait_time = remaining_ns / 1_000_000_000
+            if len(recycled_worker_managers) > 0:
+                wait_time = min(wait_time, HEARTBEAT_PERIOD)
+
+            ready_queues = queue_proxy_wrapper.QueueProxyWrapper.wait_for_any(queues, wait_time)
+
+            # One log record per wakeup, only from the queues that woke it
+            messages = []
+            for output in ready_queues:
+                messages.extend(output.get_many(MAIN_QUEUE_BATCH_SIZE))
+
+            if len(messages) > 0:
+                log_info(f"Received {len(messages)} messages: {messages}")
+
+            for manager in recycled_worker_managers:
+                if manager.are_workers_alive():
+                    continue
+
+                # No listener thread running while restarting forks main
+                if log_listener is not None:
+                    log_listener.stop()
+
+                result = manager.check_and_restart_dead_workers()
+
+                if log_listener is not None:
+                    log_listener.start()
+
+                if not result:
+                    main_logger.error("Failed to restart workers, stopping")
+                    is_restart_failed = True
                     break
 
-            except queue.Empty:
-                continue
-        time.sleep(1)
-
-    # Stop the processes
-    main_controller.request_exit()
-    main_logger.info("Requested exit")
+            if is_restart_failed:
+                break
+
+        # Stop the processes
+        main_controller.request_exit()
+        main_logger.info("Requested exit")
+
+        # Read until every worker's exit sentinel (None) has arrived
+        for output, worker_count in [
+            (receiver_queue, receiver_worker_count),
+            (command_queue, command_worker_count),
+        ]:
+            messages = output.drain_until_sentinels(worker_count, WORKER_EXIT_TIMEOUT)
+            if len(messages) > 0:
+                log_info(f"Received {len(messages)} messages: {messages}")
+        main_logger.info("Queues cleared")
+
+        # Clean up worker processes
+        for manager in worker_managers:
+            manager.join_workers(WORKER_EXIT_TIMEOUT)
+    finally:
+        if telemetry_ring_buffer is not None:
+            telemetry_ring_buffer.close()
+            telemetry_ring_buffer.unlink()
 
-    # Fill and drain queues from END TO START
-    receiver_queue.fill_and_drain_queue()
-    telemetry_queue.fill_and_drain_queue()
-    command_queue.fill_and_drain_queue()
-    main_logger.info("Queues cleared")
-
-    # Clean up worker processes
-    main_worker_manager.join_workers()
     main_logger.info("Stopped")
 
     # We can reset controller in case we want to reuse it
     # Alternatively, create a new WorkerController instance
     main_controller = worker_controller.WorkerController()
+
+    if is_restart_failed:
+        return -1
     # =============================================================================================
     #                         ↑ BOOTCAMPERS MODIFY ABOVE THIS COMMENT ↑
     # =============================================================================================
@@ -223,6 +359,10 @@ def main() -> int:
 
 
 if __name__ == "__main__":
+    # Workers inherit the connection and work arguments instead of unpickling them
+    if sys.platform == "linux":
+        mp.set_start_method("fork")
+
     result_main = main()
     if result_main < 0:
         print(f"Failed with return code {result_main}")
@@ -5,7 +5,6 @@ python -m documentation.main_multiprocess_example
 ```
 """
 
-import multiprocessing as mp
 import time
 
 from documentation.multiprocess_example.add_random import add_random_worker
@@ -56,20 +55,12 @@ def main() -> int:
     # for creating supporting interprocess communication
     controller = worker_controller.WorkerController()
 
-    # mp.Queue has possible race conditions in the same process
-    # caused by its implementation (background thread work)
-    # so a queue from a SyncManager is used instead
-    # See 2nd note: https://docs.python.org/3/library/multiprocessing.html#pipes-and-queues
-    mp_manager = mp.Manager()
-
     # Queue maxsize should always be >= the larger of producers/consumers count
     # Example: Producers 3, consumers 2, so queue maxsize minimum is 3
     countup_to_add_random_queue = queue_proxy_wrapper.QueueProxyWrapper(
-        mp_manager,
         COUNTUP_TO_ADD_RANDOM_QUEUE_MAX_SIZE,
     )
     add_random_to_concatenator_queue = queue_proxy_wrapper.QueueProxyWrapper(
-        mp_manager,
         ADD_RANDOM_TO_CONCATENATOR_QUEUE_MAX_SIZE,
     )
 
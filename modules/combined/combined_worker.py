@@ -0,0 +1,150 @@
+"""
+Worker that sends and receives heartbeats, gathers telemetry and makes decisions in one process.
+"""
+
+import os
+import pathlib
+import time
+
+from pymavlink import mavutil
+
+from utilities.workers import queue_proxy_wrapper
+from utilities.workers import worker_controller
+from ..command import command
+from ..common.modules.logger import logger
+from ..heartbeat import heartbeat_receiver
+from ..heartbeat import heartbeat_sender
+from ..telemetry import telemetry
+
+
+_MSG_ID_HEARTBEAT = mavutil.mavlink.MAVLINK_MSG_ID_HEARTBEAT
+
+# Wait after a wakeup that had nothing to read, which happens when the drone closes the connection
+EMPTY_READ_BACKOFF = 0.1  # seconds
+
+
+def combined_worker(
+    connection: mavutil.mavfile,
+    target: command.Position,
+    heartbeat_period: float,
+    heartbeat_output_queue: queue_proxy_wrapper.QueueProxyWrapper,
+    command_output_queue: queue_proxy_wrapper.QueueProxyWrapper,
+    controller: worker_controller.WorkerController,
+) -> None:
+    """
+    Worker process, in place of the heartbeat sender, heartbeat receiver, telemetry and command
+    workers. Every message is read once from the connection and handed to its consumer directly,
+    so telemetry reaches the decision without crossing a process boundary.
+
+    connection is the MAVLink connection to the drone.
+    target is the position the drone is sent to.
+    heartbeat_period is the time between heartbeats in seconds.
+    heartbeat_output_queue is where the connection status is put once per heartbeat period.
+    command_output_queue is where the commands made are put.
+    controller is how the main process communicates to this worker process.
+    """
+    # Instantiate logger
+    worker_name = pathlib.Path(__file__).stem
+    process_id = os.getpid()
+    result, local_logger = logger.Logger.create(f"{worker_name}_{process_id}", True)
+    if not result:
+        print("ERROR: Worker failed to create logger")
+        return
+
+    # Get Pylance to stop complaining
+    assert local_logger is not None
+
+    local_logger.info("Logger initialized", True)
+
+    result, sender_instance = heartbeat_sender.HeartbeatSender.create(connection, local_logger)
+    if not result:
+        local_logger.error("Failed to create HeartbeatSender instance.")
+        return
+
+    result, receiver_instance = heartbeat_receiver.HeartbeatReceiver.create(
+        connection, local_logger, heartbeat_period
+    )
+    if not result:
+        local_logger.error("Failed to create HeartbeatReceiver instance.")
+        return
+
+    result, telemetry_instance = telemetry.Telemetry.create(connection, local_logger)
+    if not result:
+        local_logger.error("Failed to create Telemetry instance.")
+        return
+
+    result, command_instance = command.Command.create(connection, target, local_logger)
+    if not result:
+        local_logger.error("Failed to create Command instance.")
+        return
+
+    # Get Pylance to stop complaining
+    assert sender_instance is not None
+    assert receiver_instance is not None
+    assert telemetry_instance is not None
+    assert command_instance is not None
+
+    is_exit_requested = controller.is_exit_requested
+    wait_or_exit = controller.wait_or_exit
+    check_pause = controller.check_pause
+    recv_match = connection.recv_match
+    select = connection.select
+    add_message = telemetry_instance.add_message
+    take_telemetry_data = telemetry_instance.take_telemetry_data
+    run_command = command_instance.run
+    put_status = heartbeat_output_queue.queue.put
+    put_command = command_output_queue.queue.put
+    monotonic_ns = time.monotonic_ns
+    heartbeat_period_ns = int(heartbeat_period * 1_000_000_000)
+
+    next_heartbeat_time_ns = monotonic_ns()
+    is_heartbeat_received = False
+
+    while not is_exit_requested():
+        check_pause()
+
+        # Heartbeats are sent and the connection status is reported once per period
+        now_ns = monotonic_ns()
+        if now_ns >= next_heartbeat_time_ns:
+            sender_instance.run()
+            put_status(receiver_instance.update(is_heartbeat_received))
+            is_heartbeat_received = False
+            next_heartbeat_time_ns = max(next_heartbeat_time_ns + heartbeat_period_ns, now_ns)
+
+        # Sleep until the connection has bytes to read or the next heartbeat is due
+        is_readable = select(max(next_heartbeat_time_ns - monotonic_ns(), 0) / 1_000_000_000)
+
+        message_count = 0
+        try:
+            # Drain everything already buffered, handing each message to its consumer
+            msg = recv_match(blocking=False)
+            while msg is not None:
+                message_count += 1
+                if msg.id != _MSG_ID_HEARTBEAT:
+                    add_message(msg)
+                elif msg.get_type() == "HEARTBEAT":
+                    # Bad data is reported with the same id
+                    is_heartbeat_received = True
+
+                msg = recv_match(blocking=False)
+        except (OSError, mavutil.mavlink.MAVError) as e:
+            local_logger.error(f"Error in combined worker loop: {e}")
+
+        # A closed connection stays readable without ever yielding a message
+        if is_readable and message_count == 0:
+            if wait_or_exit(EMPTY_READ_BACKOFF):
+                break
+
+            continue
+
+        telemetry_data = take_telemetry_data()
+        if telemetry_data is not None:
+            command_string = run_command(telemetry_data)
+            if command_string:
+                put_command(command_string)
+
+    # Sentinels so the consumer knows this worker is done
+    put_status(None)
+    put_command(None)
+
+    local_logger.info("Worker has been terminated.", True)
@@ -2,7 +2,10 @@
 Decision-making logic.
 """
 
+import functools
+import logging
 import math
+from typing import Final
 
 from pymavlink import mavutil
 
@@ -15,6 +18,8 @@ class Position:
     3D vector struct.
     """
 
+    __slots__ = ("x", "y", "z")
+
     def __init__(self, x: float, y: float, z: float) -> None:
         self.x = x
         self.y = y
@@ -24,12 +29,56 @@ class Position:
 # =================================================================================================
 #           ↓ BOOTCAMPERS MODIFY BELOW THIS COMMENT ↓
 # =================================================================================================
+# Bound once at import instead of looked up in the math module on every decision
+# Final lets an ahead of time compiler (mypyc) inline the constants
+_PI: Final = math.pi
+_TWO_PI: Final = 2 * math.pi
+_atan2 = math.atan2
+_degrees = math.degrees
+_MAV_CMD_CONDITION_CHANGE_ALT: Final = mavutil.mavlink.MAV_CMD_CONDITION_CHANGE_ALT
+_MAV_CMD_CONDITION_YAW: Final = mavutil.mavlink.MAV_CMD_CONDITION_YAW
+
+
+def _yaw_and_altitude_error(
+    target_x: float,
+    target_y: float,
+    target_z: float,
+    x: float,
+    y: float,
+    z: float,
+    yaw: float,
+) -> "tuple[float, float]":
+    """
+    Numeric part of a decision, kept to plain floats so it can be compiled on its own.
+
+    Returns the yaw change in degrees in [-180, 180) to face the target,
+    and the altitude change in metres to reach it.
+    """
+    target_yaw_rad = _atan2(target_y - y, target_x - x)
+    # Single modulo wraps to [-pi, pi), instead of atan2(sin(d), cos(d))
+    delta_yaw_rad = (target_yaw_rad - yaw + _PI) % _TWO_PI - _PI
+    return _degrees(delta_yaw_rad), target_z - z
+
+
 class Command:  # pylint: disable=too-many-instance-attributes
     """
     Command class to make a decision based on recieved telemetry,
     and send out commands based upon the data.
     """
 
+    __slots__ = (
+        "_connection",
+        "_target",
+        "_local_logger",
+        "_altitude_threshold",
+        "_yaw_threshold_deg",
+        "_input_count",
+        "_velocity_sum",
+        "_send_change_altitude",
+        "_send_change_yaw",
+        "_is_enabled_for",
+    )
+
     __private_key = object()
 
     @classmethod
@@ -69,55 +118,76 @@ class Command:  # pylint: disable=too-many-instance-attributes
         self._altitude_threshold = altitude_threshold
         self._yaw_threshold_deg = yaw_threshold_deg
         self._input_count = 0
-        self._x_velocity = 0
-        self._y_velocity = 0
-        self._z_velocity = 0
+        # Running sum of (x, y, z) velocity, kept together so each run reads and writes it once
+        self._velocity_sum = (0.0, 0.0, 0.0)
+
+        self._is_enabled_for = local_logger.logger.isEnabledFor
+
+        # Commands with the constant fields already bound, only the changing ones are passed
+        self._send_change_altitude = functools.partial(
+            connection.mav.command_long_send,
+            target_system=1,
+            target_component=0,
+            command=_MAV_CMD_CONDITION_CHANGE_ALT,
+            confirmation=0,
+            param1=1,
+            param2=0,
+            param3=0,
+            param4=0,
+            param5=0,
+            param6=0,
+        )
+        self._send_change_yaw = functools.partial(
+            connection.mav.command_long_send,
+            target_system=1,
+            target_component=0,
+            command=_MAV_CMD_CONDITION_YAW,
+            confirmation=0,
+            param2=5,
+            param4=1,
+            param5=0,
+            param6=0,
+            param7=0,
+        )
 
     def run(self, telemetry_data: telemetry.TelemetryData) -> str | None:
         """
         Make a decision based on received telemetry data.
         """
         self._input_count += 1
-        self._x_velocity += telemetry_data.x_velocity
-        self._y_velocity += telemetry_data.y_velocity
-        self._z_velocity += telemetry_data.z_velocity
-        avg_velo = (
-            self._x_velocity / self._input_count,
-            self._y_velocity / self._input_count,
-            self._z_velocity / self._input_count,
+        x_velocity_sum, y_velocity_sum, z_velocity_sum = self._velocity_sum
+        x_velocity_sum += telemetry_data.x_velocity
+        y_velocity_sum += telemetry_data.y_velocity
+        z_velocity_sum += telemetry_data.z_velocity
+        self._velocity_sum = (x_velocity_sum, y_velocity_sum, z_velocity_sum)
+
+        # The average is only used for logging, skip building it when INFO is filtered out
+        if self._is_enabled_for(logging.INFO):
+            input_count = self._input_count
+            avg_velo = (
+                x_velocity_sum / input_count,
+                y_velocity_sum / input_count,
+                z_velocity_sum / input_count,
+            )
+            self._local_logger.info(f"Average velocity: {avg_velo}", False)
+
+        target = self._target
+        delta_yaw_deg, position_error_z = _yaw_and_altitude_error(
+            target.x,
+            target.y,
+            target.z,
+            telemetry_data.x,
+            telemetry_data.y,
+            telemetry_data.z,
+            telemetry_data.yaw,
         )
-
-        self._local_logger.info(f"Average velocity: {avg_velo}")
-
-        position_error_x = self._target.x - telemetry_data.x
-        position_error_y = self._target.y - telemetry_data.y
-        position_error_z = self._target.z - telemetry_data.z
         if abs(position_error_z) > self._altitude_threshold:
             try:
-                self._connection.mav.command_long_send(
-                    target_system=1,
-                    target_component=0,
-                    command=mavutil.mavlink.MAV_CMD_CONDITION_CHANGE_ALT,
-                    confirmation=0,
-                    param1=1,
-                    param2=0,
-                    param3=0,
-                    param4=0,
-                    param5=0,
-                    param6=0,
-                    param7=self._target.z,
-                )
+                self._send_change_altitude(param7=target.z)
                 return f"CHANGE_ALTITUDE: {position_error_z:.2f}"
             except (OSError, mavutil.mavlink.MAVError) as e:
                 self._local_logger.error(f"Failed to send MAV_CMD_CONDITION_CHANGE_ALT: {e}")
 
-        target_yaw_rad = math.atan2(position_error_y, position_error_x)
-        current_yaw_rad = telemetry_data.yaw
-
-        delta_yaw_rad = target_yaw_rad - current_yaw_rad
-        delta_yaw_rad = (delta_yaw_rad + math.pi) % (2 * math.pi) - math.pi
-        delta_yaw_deg = math.degrees(delta_yaw_rad)
-
         if abs(delta_yaw_deg) > self._yaw_threshold_deg:
             if delta_yaw_deg > 0:
                 direction = -1
@@ -125,19 +195,7 @@ class Command:  # pylint: disable=too-many-instance-attributes
                 direction = 1
 
             try:
-                self._connection.mav.command_long_send(
-                    target_system=1,
-                    target_component=0,
-                    command=mavutil.mavlink.MAV_CMD_CONDITION_YAW,
-                    confirmation=0,
-                    param1=delta_yaw_deg,
-                    param2=5,
-                    param3=direction,
-                    param4=1,
-                    param5=0,
-                    param6=0,
-                    param7=0,
-                )
+                self._send_change_yaw(param1=delta_yaw_deg, param3=direction)
                 return f"CHANGING_YAW: {delta_yaw_deg:.2f}"
             except (OSError, mavutil.mavlink.MAVError) as e:
                 self._local_logger.error(f"Failed to send MAV_CMD_CONDITION_YAW: {e}")
@@ -4,6 +4,7 @@ Command worker to make decisions based on Telemetry Data.
 
 import os
 import pathlib
+import queue
 
 from pymavlink import mavutil
 
@@ -11,6 +12,11 @@ from utilities.workers import queue_proxy_wrapper
 from utilities.workers import worker_controller
 from . import command
 from ..common.modules.logger import logger
+from ..telemetry import telemetry
+
+
+# Time waiting for telemetry before checking whether exit has been requested
+INPUT_QUEUE_TIMEOUT = 1.0  # seconds
 
 
 # =================================================================================================
@@ -19,6 +25,7 @@ from ..common.modules.logger import logger
 def command_worker(
     connection: mavutil.mavfile,
     target: command.Position,
+    telemetry_worker_count: int,
     input_queue: queue_proxy_wrapper.QueueProxyWrapper,
     output_queue: queue_proxy_wrapper.QueueProxyWrapper,
     controller: worker_controller.WorkerController,
@@ -29,7 +36,8 @@ def command_worker(
     Args:
         connection: MAVLink connection to the drone for sending commands
         target: Target position (x, y, z coordinates) for the drone to reach
-        input_queue: Queue containing telemetry data from the telemetry worker
+        telemetry_worker_count: Number of telemetry workers putting into the input queue
+        input_queue: Queue containing serialized telemetry data from the telemetry worker
         output_queue: Queue to send generated commands to the main process
         controller: Worker controller for managing worker lifecycle (pause/exit)
         altitude_threshold: Maximum altitude error before sending altitude change command (meters)
@@ -62,20 +70,45 @@ def command_worker(
         local_logger.error("Failed to create Command instance.")
         return
 
-    # Main loop: do work.
-    while not controller.is_exit_requested():
-        controller.check_pause()
+    # Main loop: do work until every telemetry worker's sentinel (None) has arrived.
+    # A telemetry worker that dies never puts its sentinel, so once exit has been requested
+    # the worker also stops when the queue stays empty. Everything still buffered is read first,
+    # so a telemetry worker is not left blocked on a full queue.
+    sentinel_count = 0
+
+    is_exit_requested = controller.is_exit_requested
+    check_pause = controller.check_pause
+    get = input_queue.queue.get
+    put = output_queue.queue.put
+    unpack = telemetry.TelemetryData.unpack
+    run = command_instance.run
+
+    while sentinel_count < telemetry_worker_count:
+        check_pause()
 
         try:
-            telemetry_data = input_queue.queue.get()
+            telemetry_record = get(timeout=INPUT_QUEUE_TIMEOUT)
+        except queue.Empty:
+            if is_exit_requested():
+                break
 
-            command_string = command_instance.run(telemetry_data)
+            continue
+
+        if telemetry_record is None:
+            sentinel_count += 1
+            continue
+
+        try:
+            command_string = run(unpack(telemetry_record))
 
             if command_string:
-                output_queue.queue.put(command_string)
+                put(command_string)
         except (OSError, mavutil.mavlink.MAVError) as e:
             local_logger.error(f"Error in command worker loop: {e}")
 
+    # Sentinel so the consumer knows this worker is done
+    output_queue.queue.put(None)
+
     local_logger.info("Command worker finished successfully.")
 
 
@@ -2,7 +2,9 @@
 Heartbeat receiving logic.
 """
 
+import logging
 import time
+
 from pymavlink import mavutil
 
 from ..common.modules.logger import logger
@@ -11,7 +13,7 @@ from ..common.modules.logger import logger
 # =================================================================================================
 #                            ↓ BOOTCAMPERS MODIFY BELOW THIS COMMENT ↓
 # =================================================================================================
-class HeartbeatReceiver:
+class HeartbeatReceiver:  # pylint: disable=too-many-instance-attributes
     """
     HeartbeatReceiver class to send a heartbeat
     """
@@ -23,12 +25,15 @@ class HeartbeatReceiver:
         cls,
         connection: mavutil.mavfile,
         local_logger: logger.Logger,
+        heartbeat_period: float = 1.0,
     ) -> "tuple[True, HeartbeatReceiver] | tuple[False, None]":
         """
         Falliable create (instantiation) method to create a HeartbeatReceiver object.
+
+        heartbeat_period: Time between heartbeats in seconds.
         """
         try:
-            return True, cls(cls.__private_key, connection, local_logger)
+            return True, cls(cls.__private_key, connection, local_logger, heartbeat_period)
         except (OSError, mavutil.mavlink.MAVError) as e:
             local_logger.error(f"Failed to create HeartbeatReceiver due to MAVLink/OS error: {e}")
             return False, None
@@ -38,14 +43,18 @@ class HeartbeatReceiver:
         key: object,
         connection: mavutil.mavfile,
         local_logger: logger.Logger,
+        heartbeat_period: float,
     ) -> None:
         assert key is HeartbeatReceiver.__private_key, "Use create() method"
         self._connection = connection
         self._local_logger = local_logger
-        self._last_heartbeat_time = time.time()
+        # Monotonic integer nanoseconds, immune to wall clock jumps
+        self._last_heartbeat_time_ns = time.monotonic_ns()
+        self._heartbeat_period_ns = int(heartbeat_period * 1_000_000_000)
         self._missing_count = 0
         self._status = "Disconnected"
         self.max_threshold = 5
+        self._is_enabled_for = local_logger.logger.isEnabledFor
 
     def run(self) -> str:
         """
@@ -55,28 +64,41 @@ class HeartbeatReceiver:
         """
         try:
             msg = self._connection.recv_match(type="HEARTBEAT", blocking=False, timeout=1.0)
+        except (OSError, mavutil.mavlink.MAVError) as e:
+            self._local_logger.error(f"Error in HeartbeatReceiver.run: {e}")
+            return self._status
 
-            if msg:
-                self._last_heartbeat_time = time.time()
-                self._missing_count = 0
-                self._status = "Connected"
-                self._local_logger.info("Connection status: Connected")
+        return self.update(msg is not None)
 
-            else:
-                time_since_last_heartbeat = time.time() - self._last_heartbeat_time
-                if time_since_last_heartbeat >= 1.0:
-                    self._missing_count += 1
-                    self._local_logger.warning(f"Missed a heartbeat. Count: {self._missing_count}")
+    def update(self, is_heartbeat_received: bool) -> str:
+        """
+        Updates the connection status once per heartbeat period,
+        for callers that receive the messages themselves.
 
-            if self._missing_count >= self.max_threshold:
-                if self._status != "Disconnected":
-                    self._status = "Disconnected"
-                    self._local_logger.error(
-                        f"Connection status: Disconnected. Heart beats went past {self.max_threshold} heartbeats."
-                    )
+        is_heartbeat_received: Whether a heartbeat arrived during the period.
 
-        except (OSError, mavutil.mavlink.MAVError) as e:
-            self._local_logger.error(f"Error in HeartbeatReceiver.run: {e}")
+        Returns the connection status.
+        """
+        if is_heartbeat_received:
+            self._last_heartbeat_time_ns = time.monotonic_ns()
+            self._missing_count = 0
+            self._status = "Connected"
+            if self._is_enabled_for(logging.INFO):
+                self._local_logger.info("Connection status: Connected", False)
+
+        else:
+            time_since_last_heartbeat_ns = time.monotonic_ns() - self._last_heartbeat_time_ns
+            if time_since_last_heartbeat_ns >= self._heartbeat_period_ns:
+                self._missing_count += 1
+                if self._is_enabled_for(logging.WARNING):
+                    self._local_logger.warning(f"Missed a heartbeat. Count: {self._missing_count}")
+
+        if self._missing_count >= self.max_threshold:
+            if self._status != "Disconnected":
+                self._status = "Disconnected"
+                self._local_logger.error(
+                    f"Connection status: Disconnected. Heart beats went past {self.max_threshold} heartbeats."
+                )
 
         return self._status
 
@@ -4,7 +4,6 @@ Heartbeat worker that sends heartbeats periodically.
 
 import os
 import pathlib
-import time
 
 from pymavlink import mavutil
 
@@ -57,15 +56,26 @@ def heartbeat_receiver_worker(
         local_logger.error("Failed to create HeartbeatReceiver instance.")
         return
 
-    # Loop forever until exit has been requested
-    while not controller.is_exit_requested():
-        controller.check_pause()
+    is_exit_requested = controller.is_exit_requested
+    wait_or_exit = controller.wait_or_exit
+    check_pause = controller.check_pause
+    run = heartbeat_receiver_instance.run
+    put = output_queue.queue.put
 
-        status = heartbeat_receiver_instance.run()
+    # Loop forever until exit has been requested. Not recycled, the missed heartbeat count and
+    # connection status would restart from scratch in a new process.
+    while not is_exit_requested():
+        check_pause()
 
-        output_queue.queue.put(status)
+        status = run()
 
-        time.sleep(1)
+        put(status)
+
+        if wait_or_exit(1):
+            break
+
+    # Sentinel so the consumer knows this worker is done
+    output_queue.queue.put(None)
 
 
 # =================================================================================================
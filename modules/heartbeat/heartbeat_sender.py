@@ -2,13 +2,22 @@
 Heartbeat sending logic.
 """
 
+import logging
+
 from pymavlink import mavutil
+
 from ..common.modules.logger import logger
 
 
 # =================================================================================================
 #                            ↓ BOOTCAMPERS MODIFY BELOW THIS COMMENT ↓
 # =================================================================================================
+# Bound once at import instead of looked up in the mavlink module on every heartbeat
+_MAV_TYPE_GCS = mavutil.mavlink.MAV_TYPE_GCS
+_MAV_AUTOPILOT_INVALID = mavutil.mavlink.MAV_AUTOPILOT_INVALID
+_MAV_STATE_ACTIVE = mavutil.mavlink.MAV_STATE_ACTIVE
+
+
 class HeartbeatSender:
     """
     HeartbeatSender class to send a heartbeat
@@ -43,6 +52,7 @@ class HeartbeatSender:
         # Do any intializiation here
         self._connection = connection
         self._local_logger = local_logger
+        self._is_enabled_for = local_logger.logger.isEnabledFor
 
     def run(
         self,
@@ -52,13 +62,14 @@ class HeartbeatSender:
         """
         try:
             self._connection.mav.heartbeat_send(
-                type=mavutil.mavlink.MAV_TYPE_GCS,
-                autopilot=mavutil.mavlink.MAV_AUTOPILOT_INVALID,
+                type=_MAV_TYPE_GCS,
+                autopilot=_MAV_AUTOPILOT_INVALID,
                 base_mode=0,
                 custom_mode=0,
-                system_status=mavutil.mavlink.MAV_STATE_ACTIVE,
+                system_status=_MAV_STATE_ACTIVE,
             )
-            self._local_logger.info("Heartbeat sent.")
+            if self._is_enabled_for(logging.INFO):
+                self._local_logger.info("Heartbeat sent.", False)
         except (OSError, mavutil.mavlink.MAVError) as e:
             self._local_logger.error(f"Failed to send heartbeat: {e}")
 
@@ -4,7 +4,6 @@ Heartbeat worker that sends heartbeats periodically.
 
 import os
 import pathlib
-import time
 
 from pymavlink import mavutil
 
@@ -13,6 +12,10 @@ from . import heartbeat_sender
 from ..common.modules.logger import logger
 
 
+# Iterations before the worker exits to be restarted, so anything leaked is freed
+RECYCLE_ITERATIONS = 3600
+
+
 # =================================================================================================
 #                            ↓ BOOTCAMPERS MODIFY BELOW THIS COMMENT ↓
 # =================================================================================================
@@ -52,13 +55,17 @@ def heartbeat_sender_worker(
         connection, local_logger
     )
 
-    # Main loop: do work.
-    while not controller.is_exit_requested():
+    # Main loop: do work until exit has been requested or it is time to recycle
+    for _ in range(RECYCLE_ITERATIONS):
+        if controller.is_exit_requested():
+            break
+
         controller.check_pause()
 
         heartbeat_sender_instance.run()
 
-        time.sleep(1)
+        if controller.wait_or_exit(1):
+            break
 
     local_logger.info("Worker finished.", True)
 
@@ -2,6 +2,10 @@
 Telemetry gathering logic.
 """
 
+import dataclasses
+import math
+import operator
+import struct
 import time
 
 from pymavlink import mavutil
@@ -9,63 +13,78 @@ from pymavlink import mavutil
 from ..common.modules.logger import logger
 
 
-# pylint: disable=too-many-instance-attributes, too-many-arguments
+# pylint: disable=too-many-instance-attributes
+@dataclasses.dataclass(slots=True)
 class TelemetryData:
     """
     Python struct to represent Telemtry Data. Contains the most recent attitude and position reading.
     """
 
-    def __init__(
-        self,
-        time_since_boot: int | None = None,  # ms
-        x: float | None = None,  # m
-        y: float | None = None,  # m
-        z: float | None = None,  # m
-        x_velocity: float | None = None,  # m/s
-        y_velocity: float | None = None,  # m/s
-        z_velocity: float | None = None,  # m/s
-        roll: float | None = None,  # rad
-        pitch: float | None = None,  # rad
-        yaw: float | None = None,  # rad
-        roll_speed: float | None = None,  # rad/s
-        pitch_speed: float | None = None,  # rad/s
-        yaw_speed: float | None = None,  # rad/s
-    ) -> None:
-        self.time_since_boot = time_since_boot
-        self.x = x
-        self.y = y
-        self.z = z
-        self.x_velocity = x_velocity
-        self.y_velocity = y_velocity
-        self.z_velocity = z_velocity
-        self.roll = roll
-        self.pitch = pitch
-        self.yaw = yaw
-        self.roll_speed = roll_speed
-        self.pitch_speed = pitch_speed
-        self.yaw_speed = yaw_speed
-
-    def __str__(self) -> str:
-        return f"""{{
-            time_since_boot: {self.time_since_boot},
-            x: {self.x},
-            y: {self.y},
-            z: {self.z},
-            x_velocity: {self.x_velocity},
-            y_velocity: {self.y_velocity},
-            z_velocity: {self.z_velocity},
-            roll: {self.roll},
-            pitch: {self.pitch},
-            yaw: {self.yaw},
-            roll_speed: {self.roll_speed},
-            pitch_speed: {self.pitch_speed},
-            yaw_speed: {self.yaw_speed}
-        }}"""
+    # Slots instead of a per instance __dict__, one of these is built for every telemetry message
+    time_since_boot: int | None = None  # ms
+    x: float | None = None  # m
+    y: float | None = None  # m
+    z: float | None = None  # m
+    x_velocity: float | None = None  # m/s
+    y_velocity: float | None = None  # m/s
+    z_velocity: float | None = None  # m/s
+    roll: float | None = None  # rad
+    pitch: float | None = None  # rad
+    yaw: float | None = None  # rad
+    roll_speed: float | None = None  # rad/s
+    pitch_speed: float | None = None  # rad/s
+    yaw_speed: float | None = None  # rad/s
+
+    # Every field as a float64, None is stored as NaN
+    RECORD_FORMAT = "=13d"
+    RECORD_SIZE = struct.calcsize(RECORD_FORMAT)
+    # Compiled once, skips the format lookup on every record
+    __RECORD_STRUCT = struct.Struct(RECORD_FORMAT)
+
+    def pack(self) -> bytes:
+        """
+        Serializes the fields into a fixed size record, much smaller and faster than pickle.
+
+        Returns the record.
+        """
+        values = _get_record_fields(self)
+        return TelemetryData.__RECORD_STRUCT.pack(
+            *[math.nan if value is None else value for value in values]
+        )
+
+    @classmethod
+    def unpack(cls, data: bytes) -> "TelemetryData":
+        """
+        Deserializes a record from pack().
+
+        data: Record.
+
+        Returns the TelemetryData.
+        """
+        isnan = math.isnan
+        values = [
+            None if isnan(value) else value for value in TelemetryData.__RECORD_STRUCT.unpack(data)
+        ]
+        if values[0] is not None:
+            values[0] = int(values[0])
+
+        return cls(*values)
+
+
+# Reads every field in record order in one call
+_get_record_fields = operator.attrgetter(
+    *(field.name for field in dataclasses.fields(TelemetryData))
+)
 
 
 # =================================================================================================
 #           ↓ BOOTCAMPERS MODIFY BELOW THIS COMMENT ↓
 # =================================================================================================
+# Integer message ids, compared instead of calling get_type() for every message
+_MSG_ID_ATTITUDE = mavutil.mavlink.MAVLINK_MSG_ID_ATTITUDE
+_MSG_ID_LOCAL_POSITION_NED = mavutil.mavlink.MAVLINK_MSG_ID_LOCAL_POSITION_NED
+
+
 class Telemetry:  # pylint: disable=too-many-instance-attributes
     """
     Telemetry class to read position and attitude (orientation).
@@ -100,55 +119,101 @@ class Telemetry:  # pylint: disable=too-many-instance-attributes
         self._local_logger = local_logger
         self._last_position = None
         self._last_attitude = None
+        # Filled in place by take_telemetry_data() instead of allocating one per pair
+        self._telemetry_data = TelemetryData()
+
+    def add_message(self, msg: mavutil.mavlink.MAVLink_message) -> None:
+        """
+        Keeps an ATTITUDE or LOCAL_POSITION_NED message, replacing the previous one of its type.
+        Other messages are ignored.
+        """
+        msg_id = msg.id
+        if msg_id == _MSG_ID_ATTITUDE:
+            self._last_attitude = msg
+        elif msg_id == _MSG_ID_LOCAL_POSITION_NED:
+            self._last_position = msg
+
+    def take_telemetry_data(self) -> TelemetryData | None:
+        """
+        Combines the kept ATTITUDE and LOCAL_POSITION_NED messages into a TelemetryData
+        and starts collecting the next pair.
+
+        The same TelemetryData is refilled by every call, so copy it (e.g. with pack())
+        before calling again if it must outlive the next call.
+
+        Returns None if either message has not arrived yet.
+        """
+        position = self._last_position
+        attitude = self._last_attitude
+        if not (position and attitude):
+            return None
+
+        self._last_position = None
+        self._last_attitude = None
+
+        telemetry_data = self._telemetry_data
+        telemetry_data.time_since_boot = max(position.time_boot_ms, attitude.time_boot_ms)
+        telemetry_data.x = position.x
+        telemetry_data.y = position.y
+        telemetry_data.z = position.z
+        telemetry_data.x_velocity = position.vx
+        telemetry_data.y_velocity = position.vy
+        telemetry_data.z_velocity = position.vz
+        telemetry_data.roll = attitude.roll
+        telemetry_data.pitch = attitude.pitch
+        telemetry_data.yaw = attitude.yaw
+        telemetry_data.roll_speed = attitude.rollspeed
+        telemetry_data.pitch_speed = attitude.pitchspeed
+        telemetry_data.yaw_speed = attitude.yawspeed
+
+        return telemetry_data
 
     def run(
         self,
+        timeout: float = 1.0,
+        reset_on_timeout: bool = True,
     ) -> TelemetryData | None:
         """
         Receive LOCAL_POSITION_NED and ATTITUDE messages from the drone,
         combining them together to form a single TelemetryData object.
-        """
-        start_time = time.time()
-
-        # Set to smaller than 1.0, as 1.0s is the timeout
-        while time.time() - start_time < 1.0:
-            msg = self._connection.recv_match(blocking=False)
-            if msg:
-                if msg.get_type() == "ATTITUDE":
-                    self._last_attitude = msg
-                elif msg.get_type() == "LOCAL_POSITION_NED":
-                    self._last_position = msg
-
-            if self._last_position and self._last_attitude:
-                telemetry_data = TelemetryData()
-
-                if self._last_position.time_boot_ms > self._last_attitude.time_boot_ms:
-                    telemetry_data.time_since_boot = self._last_position.time_boot_ms
-                else:
-                    telemetry_data.time_since_boot = self._last_attitude.time_boot_ms
-
-                telemetry_data.x = self._last_position.x
-                telemetry_data.y = self._last_position.y
-                telemetry_data.z = self._last_position.z
-                telemetry_data.x_velocity = self._last_position.vx
-                telemetry_data.y_velocity = self._last_position.vy
-                telemetry_data.z_velocity = self._last_position.vz
-
-                telemetry_data.roll = self._last_attitude.roll
-                telemetry_data.pitch = self._last_attitude.pitch
-                telemetry_data.yaw = self._last_attitude.yaw
-                telemetry_data.roll_speed = self._last_attitude.rollspeed
-                telemetry_data.pitch_speed = self._last_attitude.pitchspeed
-                telemetry_data.yaw_speed = self._last_attitude.yawspeed
-
-                self._last_position = None
-                self._last_attitude = None
+        The object is reused by the next call, see take_telemetry_data().
+
+        timeout: Time waiting in seconds for both messages.
+        reset_on_timeout: Whether to drop a message received without its pair on timeout,
+            False to keep it for the next call.
 
+        Returns None on timeout.
+        """
+        deadline = time.monotonic() + timeout
+
+        recv_match = self._connection.recv_match
+        select = self._connection.select
+        add_message = self.add_message
+        get_time = time.monotonic
+
+        while True:
+            # Drain everything already buffered, keeping only the newest of each message
+            msg = recv_match(blocking=False)
+            if msg is not None:
+                add_message(msg)
+                continue
+
+            telemetry_data = self.take_telemetry_data()
+            if telemetry_data is not None:
                 return telemetry_data
 
+            remaining_time = deadline - get_time()
+            if remaining_time <= 0.0:
+                break
+
+            # Sleep until the connection has bytes to read instead of spinning on recv_match
+            select(remaining_time)
+
         # Reset when timeout occurs to restart collection
-        self._last_position = None
-        self._last_attitude = None
+        if reset_on_timeout:
+            self._last_position = None
+            self._last_attitude = None
+
         return None
 
 
@@ -2,8 +2,10 @@
 Telemetry worker that gathers GPS data.
 """
 
+import logging
 import os
 import pathlib
+import queue
 import time
 
 from pymavlink import mavutil
@@ -14,6 +16,14 @@ from modules.common.modules.logger import logger
 from . import telemetry
 
 
+# Records are put on the queue in batches, flushed when full or this long after the last flush
+BATCH_SIZE = 16
+BATCH_PERIOD = 0.1  # seconds
+
+# Time waiting for space for the last records, the consumer may have already stopped
+EXIT_PUT_TIMEOUT = 1.0  # seconds
+
+
 # =================================================================================================
 #           ↓ BOOTCAMPERS MODIFY BELOW THIS COMMENT ↓
 # =================================================================================================
@@ -26,7 +36,7 @@ def telemetry_worker(
     Worker process.
 
     connection is the MAVLink connection to the drone.
-    output_queue is the data queue to pass TelemetryData to.
+    output_queue is the data queue to pass serialized TelemetryData to.
     controller is how the main process communicates to this worker process.
     """
     # =============================================================================================
@@ -55,23 +65,55 @@ def telemetry_worker(
         local_logger.error("Failed to create telemetry instance.")
         return
 
+    pending_records = []
+    last_flush_time = time.monotonic()
+
+    is_exit_requested = controller.is_exit_requested
+    check_pause = controller.check_pause
+    run = telemetry_instance.run
+    put_many = output_queue.put_many
+    log_info = local_logger.info
+    is_enabled_for = local_logger.logger.isEnabledFor
+    log_warning = local_logger.warning
+    get_time = time.monotonic
+
     # Main loop: do work.
-    while not controller.is_exit_requested():
-        controller.check_pause()
+    while not is_exit_requested():
+        check_pause()
 
+        # run() waits up to 1 s for the next pair. With records pending, only wait until they are
+        # due to be flushed instead, keeping a message that arrived without its pair.
+        is_flush_pending = len(pending_records) > 0
         try:
-            telemetry_data = telemetry_instance.run()
-            if telemetry_data:
-                local_logger.info("Telemetry data received and processed.")
-                output_queue.queue.put(telemetry_data)
+            if is_flush_pending:
+                telemetry_data = run(max(last_flush_time + BATCH_PERIOD - get_time(), 0.0), False)
             else:
-                local_logger.warning(
-                    "Failed to receive telemetry data - timeout or missing messages"
-                )
+                telemetry_data = run()
+
+            if telemetry_data:
+                if is_enabled_for(logging.INFO):
+                    log_info("Telemetry data received and processed.", False)
+                # Fixed size record instead of pickling the object
+                pending_records.append(telemetry_data.pack())
+            elif not is_flush_pending:
+                log_warning("Failed to receive telemetry data - timeout or missing messages")
         except (OSError, mavutil.mavlink.MAVError) as e:
             local_logger.error(f"Error in telemetry worker loop: {e}")
 
-        time.sleep(0.01)
+        now = get_time()
+        if len(pending_records) >= BATCH_SIZE or (
+            len(pending_records) > 0 and now - last_flush_time >= BATCH_PERIOD
+        ):
+            put_many(pending_records)
+            pending_records = []
+            last_flush_time = now
+
+    # Remaining records, then a sentinel so the consumer knows this worker is done
+    pending_records.append(None)
+    try:
+        output_queue.put_many(pending_records, EXIT_PUT_TIMEOUT)
+    except queue.Full:
+        local_logger.warning("Output queue full on exit, dropped the remaining records")
 
     local_logger.info("Worker has been terminated.", True)
 
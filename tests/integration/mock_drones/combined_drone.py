@@ -0,0 +1,146 @@
+"""
+Mock drone for testing the combined worker.
+"""
+
+import os
+import pathlib
+import time
+
+from pymavlink import mavutil
+
+from modules.command import command
+from modules.common.modules.logger import logger
+
+
+CONNECTION_STRING = "tcpin:localhost:12345"
+HEARTBEAT_PERIOD = 1
+TELEMETRY_PERIOD = 0.1
+NUM_TRIALS = 5
+DISCONNECT_THRESHOLD = 5
+NUM_DISCONNECTS = 2
+FLOAT_TOLERANCE = 1e-6
+TARGET = command.Position(10, 20, 30)
+
+
+def main() -> int:
+    """
+    Begin mock drone simulation to test a combined worker.
+    """
+    # Mocked autopilot/drone
+    # source_system = 1 (airside on drone)
+    # source_component = 0 (autopilot)
+    connection = mavutil.mavlink_connection(CONNECTION_STRING, source_system=1, source_component=0)
+    connection.wait_heartbeat()
+
+    # Instantiate logger after main starts
+    drone_name = pathlib.Path(__file__).stem
+    process_id = os.getpid()
+    result, local_logger = logger.Logger.create(f"{drone_name}_{process_id}", True)
+    if not result:
+        print("ERROR: Worker failed to create drone logger")
+        return -1
+
+    # Get Pylance to stop complaining
+    assert local_logger is not None
+
+    local_logger.info("Logger initialized")
+
+    boot_time = time.monotonic()
+    gcs_heartbeat_count = 0
+    command_count = 0
+
+    # Count the heartbeats and check the commands sent by the worker
+    def receive() -> int:
+        nonlocal gcs_heartbeat_count, command_count
+
+        msg = connection.recv_match(blocking=False)
+        while msg is not None:
+            msg_type = msg.get_type()
+            if msg_type == "HEARTBEAT":
+                gcs_heartbeat_count += 1
+            elif msg_type == "COMMAND_LONG":
+                if msg.command not in (
+                    mavutil.mavlink.MAV_CMD_CONDITION_CHANGE_ALT,
+                    mavutil.mavlink.MAV_CMD_CONDITION_YAW,
+                ):
+                    local_logger.error("Sent incorrect command within COMMAND_LONG message.")
+                    return -1
+                if (
+                    msg.command == mavutil.mavlink.MAV_CMD_CONDITION_CHANGE_ALT
+                    and abs(msg.param7 - TARGET.z) > FLOAT_TOLERANCE
+                ):
+                    local_logger.error(f"Altitude target is not the desired value: {msg.param7}")
+                    return -2
+                command_count += 1
+                local_logger.info("Received a valid command")
+
+            msg = connection.recv_match(blocking=False)
+
+        return 0
+
+    # Task is to send telemetry every TELEMETRY_PERIOD and optionally heartbeats at 1Hz,
+    # for the given number of heartbeat periods
+    def fly(periods: int, is_sending_heartbeats: bool) -> int:
+        steps_per_heartbeat = round(HEARTBEAT_PERIOD / TELEMETRY_PERIOD)
+        start = time.monotonic()
+        for step in range(periods * steps_per_heartbeat):
+            try:
+                if is_sending_heartbeats and step % steps_per_heartbeat == 0:
+                    connection.mav.heartbeat_send(
+                        mavutil.mavlink.MAV_TYPE_GENERIC,
+                        mavutil.mavlink.MAV_AUTOPILOT_GENERIC,
+                        0,
+                        0,
+                        0,
+                    )
+                    local_logger.info("Drone: Sent a heartbeat")
+
+                time_boot_ms = int((time.monotonic() - boot_time) * 1000)
+                connection.mav.attitude_send(time_boot_ms, 0, 0, 0, 0, 0, 0)
+                connection.mav.local_position_ned_send(time_boot_ms, 0, 0, 0, 0, 0, 0)
+            # Not required, sends shouldn't raise exceptions
+            except:  # pylint: disable=bare-except
+                local_logger.error("Drone: Could not send")
+                return -1
+
+            result = receive()
+            if result != 0:
+                return result
+
+            time.sleep(max(start + (step + 1) * TELEMETRY_PERIOD - time.monotonic(), 0))
+
+        return 0
+
+    if fly(NUM_TRIALS, True) != 0:
+        return -2
+
+    # Stop sending heartbeats for long enough that the worker reports a disconnect
+    if fly(DISCONNECT_THRESHOLD + NUM_DISCONNECTS, False) != 0:
+        return -3
+
+    # Reconnect
+    if fly(NUM_TRIALS, True) != 0:
+        return -4
+
+    # The worker keeps sending heartbeats while the drone is silent
+    total_periods = 2 * NUM_TRIALS + DISCONNECT_THRESHOLD + NUM_DISCONNECTS
+    if gcs_heartbeat_count < total_periods - 1:
+        local_logger.error(
+            f"Received {gcs_heartbeat_count} heartbeats in {total_periods} heartbeat periods"
+        )
+        return -5
+
+    if command_count == 0:
+        local_logger.error("Received no commands")
+        return -6
+
+    local_logger.info("Passed!")
+    return 0
+
+
+if __name__ == "__main__":
+    result_main = main()
+    if result_main < 0:
+        print(f"Drone: Failed with return code {result_main}")
+    else:
+        print("Drone: Success!")
@@ -0,0 +1,141 @@
+"""
+Test the combined worker with a mocked drone.
+"""
+
+import multiprocessing as mp
+import subprocess
+import threading
+import time
+
+from pymavlink import mavutil
+
+from modules.combined import combined_worker
+from modules.command import command
+from modules.common.modules.logger import logger
+from modules.common.modules.logger import logger_main_setup
+from modules.common.modules.read_yaml import read_yaml
+from utilities.workers import queue_proxy_wrapper
+from utilities.workers import worker_controller
+
+
+MOCK_DRONE_MODULE = "tests.integration.mock_drones.combined_drone"
+CONNECTION_STRING = "tcp:localhost:12345"
+
+# Match the mocked drone
+HEARTBEAT_PERIOD = 1
+TARGET = command.Position(10, 20, 30)
+
+# Longer than the mocked drone runs for
+TEST_DURATION = 20
+OUTPUT_QUEUE_MAXSIZE = 100
+
+
+# Same utility functions across all the integration tests
+# pylint: disable=duplicate-code
+def start_drone() -> None:
+    """
+    Start the mocked drone.
+    """
+    subprocess.run(["python", "-m", MOCK_DRONE_MODULE], shell=True, check=False)
+
+
+def read_queues(
+    heartbeat_output_queue: queue_proxy_wrapper.QueueProxyWrapper,
+    command_output_queue: queue_proxy_wrapper.QueueProxyWrapper,
+    controller: worker_controller.WorkerController,
+    main_logger: logger.Logger,
+) -> None:
+    """
+    Read and print both output queues until exit is requested.
+    """
+    while not controller.is_exit_requested():
+        for output in queue_proxy_wrapper.QueueProxyWrapper.wait_for_any(
+            [heartbeat_output_queue, command_output_queue], 1.0
+        ):
+            for item in output.get_many(OUTPUT_QUEUE_MAXSIZE):
+                # Sentinel from the worker as it exits
+                if item is None:
+                    continue
+
+                if output is heartbeat_output_queue:
+                    main_logger.info(f"Heartbeat receiver output: {item}")
+                else:
+                    main_logger.info(f"Command: {item}")
+
+
+def main() -> int:
+    """
+    Start the combined worker simulation.
+    """
+    # Configuration settings
+    result, config = read_yaml.open_config(logger.CONFIG_FILE_PATH)
+    if not result:
+        print("ERROR: Failed to load configuration file")
+        return -1
+
+    # Get Pylance to stop complaining
+    assert config is not None
+
+    # Setup main logger
+    result, main_logger, _ = logger_main_setup.setup_main_logger(config)
+    if not result:
+        print("ERROR: Failed to create main logger")
+        return -1
+
+    # Get Pylance to stop complaining
+    assert main_logger is not None
+
+    # Mocked GCS, connect to mocked drone which is listening at CONNECTION_STRING
+    # source_system = 255 (groundside)
+    # source_component = 0 (ground control station)
+    connection = mavutil.mavlink_connection(CONNECTION_STRING)
+    connection.mav.heartbeat_send(
+        mavutil.mavlink.MAV_TYPE_GCS,
+        mavutil.mavlink.MAV_AUTOPILOT_INVALID,
+        0,
+        0,
+        0,
+    )
+    main_logger.info("Connected!")
+    # pylint: enable=duplicate-code
+
+    controller = worker_controller.WorkerController()
+    heartbeat_output_queue = queue_proxy_wrapper.QueueProxyWrapper(OUTPUT_QUEUE_MAXSIZE)
+    command_output_queue = queue_proxy_wrapper.QueueProxyWrapper(OUTPUT_QUEUE_MAXSIZE)
+
+    # Just set a timer to stop the worker after a while, since the worker infinite loops
+    threading.Timer(TEST_DURATION, controller.request_exit).start()
+
+    # Read the worker outputs
+    threading.Thread(
+        target=read_queues,
+        args=(heartbeat_output_queue, command_output_queue, controller, main_logger),
+    ).start()
+
+    combined_worker.combined_worker(
+        connection,
+        TARGET,
+        HEARTBEAT_PERIOD,
+        heartbeat_output_queue,
+        command_output_queue,
+        controller,
+    )
+
+    return 0
+
+
+if __name__ == "__main__":
+    # Start drone in another process
+    drone_process = mp.Process(target=start_drone)
+    drone_process.start()
+
+    # Give the drone process a moment to start up and listen
+    time.sleep(1)
+
+    result_main = main()
+    if result_main < 0:
+        print(f"Failed with return code {result_main}")
+    else:
+        print("Success!")
+
+    drone_process.join()
@@ -35,6 +35,8 @@ TURNING_SPEED = 5  # deg/s
 #                            ↓ BOOTCAMPERS MODIFY BELOW THIS COMMENT ↓
 # =================================================================================================
 # Add your own constants here
+# Bounded so that stop() can fill it with sentinels to end the worker
+DATA_QUEUE_MAXSIZE = 10
 
 # =================================================================================================
 #                            ↑ BOOTCAMPERS MODIFY ABOVE THIS COMMENT ↑
@@ -85,7 +87,7 @@ def put_queue(
     Place mocked inputs into the input queue periodically with period TELEMETRY_PERIOD.
     """
     for data in drone_data:
-        data_queue.queue.put(data)
+        data_queue.queue.put(data.pack())
         time.sleep(TELEMETRY_PERIOD)
 
 
@@ -137,12 +139,9 @@ def main() -> int:
     # Create a worker controller for your worker
     worker_controller_instance = worker_controller.WorkerController()
 
-    # Create a multiprocess manager for synchronized queues
-    manager = mp.Manager()
-
     # Create your queues
-    data_queue = queue_proxy_wrapper.QueueProxyWrapper(manager)
-    output_queue = queue_proxy_wrapper.QueueProxyWrapper(manager)
+    data_queue = queue_proxy_wrapper.QueueProxyWrapper(DATA_QUEUE_MAXSIZE)
+    output_queue = queue_proxy_wrapper.QueueProxyWrapper()
 
     # Test cases, DO NOT EDIT!
     path = [
@@ -308,6 +307,7 @@ def main() -> int:
     command_worker.command_worker(
         connection=connection,
         target=TARGET,
+        telemetry_worker_count=1,
         input_queue=data_queue,
         output_queue=output_queue,
         controller=worker_controller_instance,
@@ -123,11 +123,8 @@ def main() -> int:
     # Create a worker controller for your worker
     heartbeat_receiver_worker_controller = worker_controller.WorkerController()
 
-    # Create a multiprocess manager for synchronized queues
-    manager = mp.Manager()
-
-    # Create your queues by passing the manager to the wrapper's constructor
-    heartbeat_output_queue = queue_proxy_wrapper.QueueProxyWrapper(manager)
+    # Create your queues
+    heartbeat_output_queue = queue_proxy_wrapper.QueueProxyWrapper()
 
     # Just set a timer to stop the worker after a while, since the worker infinite loops
     threading.Timer(
@@ -5,13 +5,13 @@ Test the telemetry worker with a mocked drone.
 import multiprocessing as mp
 import subprocess
 import threading
-import queue as queue_module
 
 from pymavlink import mavutil
 
 from modules.common.modules.logger import logger
 from modules.common.modules.logger import logger_main_setup
 from modules.common.modules.read_yaml import read_yaml
+from modules.telemetry import telemetry
 from modules.telemetry import telemetry_worker
 from utilities.workers import queue_proxy_wrapper
 from utilities.workers import worker_controller
@@ -29,6 +29,8 @@ NUM_FAILS = 3
 #     v BOOTCAMPERS MODIFY BELOW THIS COMMENT v
 # =================================================================================================
 # Add your own constants here
+# Room for many telemetry batches, so the worker never waits on the reader
+OUTPUT_QUEUE_MAXSIZE = 1024
 
 # =================================================================================================
 #     ^ BOOTCAMPERS MODIFY ABOVE THIS COMMENT ^
@@ -60,21 +62,29 @@ def stop(
 
 def read_queue(
     queue: queue_proxy_wrapper.QueueProxyWrapper,  # Add any necessary arguments
+    controller: worker_controller.WorkerController,
     main_logger: logger.Logger,
 ) -> None:
     """
-    Read and print the output queue.
+    Read and print the output queue until exit is requested.
     """
-    while True:
-        try:
-            output_data = queue.queue.get(timeout=2)
-            main_logger.info(output_data)
-        except queue_module.Empty:
-            # No data available yet; continue polling
+    while not controller.is_exit_requested():
+        # Waits on the queue's pipe, so an idle wait does not raise queue.Empty
+        if len(queue_proxy_wrapper.QueueProxyWrapper.wait_for_any([queue], 1.0)) == 0:
             continue
+
+        try:
+            telemetry_records = queue.get_many(OUTPUT_QUEUE_MAXSIZE)
         except (OSError, ValueError, EOFError):
             break
 
+        for telemetry_record in telemetry_records:
+            # Sentinel from the worker or from draining the queue on exit
+            if telemetry_record is None:
+                continue
+
+            main_logger.info(telemetry.TelemetryData.unpack(telemetry_record))
+
 
 # =================================================================================================
 #     ^ BOOTCAMPERS MODIFY ABOVE THIS COMMENT ^
@@ -123,17 +133,15 @@ def main() -> int:
     # Mock starting a worker, since cannot actually start a new process
     # Create a worker controller for your worker
     controller = worker_controller.WorkerController()
-    # Create a multiprocess manager for synchronized queues
-    manager = mp.Manager()
     # Create your queues
-    output_queue = queue_proxy_wrapper.QueueProxyWrapper(manager)
+    output_queue = queue_proxy_wrapper.QueueProxyWrapper(OUTPUT_QUEUE_MAXSIZE)
     # Just set a timer to stop the worker after a while, since the worker infinite loops
     threading.Timer(
         TELEMETRY_PERIOD * NUM_TRIALS * 2 + NUM_FAILS, stop, (output_queue, controller)
     ).start()
 
     # Read the main queue (worker outputs)
-    threading.Thread(target=read_queue, args=(output_queue, main_logger)).start()
+    threading.Thread(target=read_queue, args=(output_queue, controller, main_logger)).start()
 
     telemetry_worker.telemetry_worker(connection, output_queue, controller)
     # =============================================================================================
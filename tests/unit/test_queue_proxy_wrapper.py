@@ -0,0 +1,127 @@
+"""
+Test the batch and shutdown helpers of the queue wrapper.
+"""
+
+import multiprocessing as mp
+import time
+
+import pytest
+
+from utilities.workers import queue_proxy_wrapper
+from utilities.workers import spsc_ring_buffer
+
+
+# Test functions use test fixture signature names
+# No enable
+# pylint: disable=redefined-outer-name
+
+
+CAPACITY = 8
+SLOT_SIZE = 8
+# Longest a test waits for other processes
+TIMEOUT = 10.0  # seconds
+
+
+@pytest.fixture()
+def ring_queue() -> queue_proxy_wrapper.QueueProxyWrapper:  # type: ignore
+    """
+    Wraps a small ring buffer queue, which publishes puts immediately, and frees it afterwards.
+    """
+    result, ring_buffer = spsc_ring_buffer.SpscRingBuffer.create(CAPACITY, SLOT_SIZE)
+    assert result
+    assert ring_buffer is not None
+
+    yield queue_proxy_wrapper.QueueProxyWrapper(  # type: ignore
+        CAPACITY, spsc_ring_buffer.SpscQueue(ring_buffer)
+    )
+
+    ring_buffer.close()
+    ring_buffer.unlink()
+
+
+def produce(output_queue: queue_proxy_wrapper.QueueProxyWrapper, first: int, count: int) -> None:
+    """
+    Puts the numbers first to first + count - 1 and then a sentinel.
+    """
+    output_queue.put_many(list(range(first, first + count)) + [None])
+
+
+class TestGetMany:
+    """
+    Getting several items in one call.
+    """
+
+    def test_upper_bound(self, ring_queue: queue_proxy_wrapper.QueueProxyWrapper) -> None:
+        """
+        At most `max_messages` items are taken, the rest stay in the queue in order.
+        """
+        ring_queue.put_many([bytes([i]) for i in range(5)])
+
+        assert ring_queue.get_many(3) == [b"\x00", b"\x01", b"\x02"]
+        assert ring_queue.get_many(10) == [b"\x03", b"\x04"]
+
+    def test_empty(self, ring_queue: queue_proxy_wrapper.QueueProxyWrapper) -> None:
+        """
+        An empty queue gives an empty list, after waiting for the timeout if there is one.
+        """
+        assert not ring_queue.get_many(3)
+
+        start = time.monotonic()
+        assert not ring_queue.get_many(3, 0.1)
+        assert time.monotonic() - start >= 0.1
+
+
+class TestDrainUntilSentinels:
+    """
+    Reading until every producer has put its sentinel.
+    """
+
+    def test_multiple_producers(self) -> None:
+        """
+        Every item from every producer is returned once all their sentinels have arrived.
+        """
+        count = 20
+        producer_count = 3
+        output_queue = queue_proxy_wrapper.QueueProxyWrapper()
+        producers = [
+            mp.Process(target=produce, args=(output_queue, i * count, count))
+            for i in range(producer_count)
+        ]
+        for producer in producers:
+            producer.start()
+
+        actual = output_queue.drain_until_sentinels(producer_count, TIMEOUT)
+
+        for producer in producers:
+            producer.join(TIMEOUT)
+
+        assert sorted(actual) == list(range(producer_count * count))
+
+    def test_missing_sentinel(self) -> None:
+        """
+        Gives up after the timeout when a producer never puts its sentinel,
+        returning the items received until then.
+        """
+        output_queue = queue_proxy_wrapper.QueueProxyWrapper()
+        output_queue.put_many([1, 2, None])
+
+        start = time.monotonic()
+        actual = output_queue.drain_until_sentinels(2, 0.2)
+        elapsed = time.monotonic() - start
+
+        assert actual == [1, 2]
+        assert 0.2 <= elapsed < TIMEOUT
+
+
+class TestPutMany:
+    """
+    Putting several items in one call.
+    """
+
+    def test_order(self, ring_queue: queue_proxy_wrapper.QueueProxyWrapper) -> None:
+        """
+        Items come out in the order they were put, sentinels included.
+        """
+        ring_queue.put_many([b"a", None, b"b"])
+
+        assert ring_queue.get_many(3) == [b"a", None, b"b"]
@@ -0,0 +1,295 @@
+"""
+Test the shared memory ring buffer.
+"""
+
+import multiprocessing as mp
+import queue
+import time
+
+import pytest
+
+from utilities.workers import spsc_ring_buffer
+
+
+# Test functions use test fixture signature names
+# No enable
+# pylint: disable=redefined-outer-name
+
+
+CAPACITY = 4
+SLOT_SIZE = 16
+BATCH_SIZE = 3
+# Longest a cross process test waits for the other side
+TIMEOUT = 10.0  # seconds
+
+
+@pytest.fixture()
+def ring() -> spsc_ring_buffer.SpscRingBuffer:  # type: ignore
+    """
+    Creates a small ring buffer and frees it afterwards.
+    """
+    result, ring_buffer = spsc_ring_buffer.SpscRingBuffer.create(CAPACITY, SLOT_SIZE)
+    assert result
+    assert ring_buffer is not None
+
+    yield ring_buffer  # type: ignore
+
+    ring_buffer.close()
+    ring_buffer.unlink()
+
+
+def produce(ring_buffer: spsc_ring_buffer.SpscRingBuffer, count: int) -> None:
+    """
+    Writes the numbers 0 to count - 1, waiting whenever the ring buffer is full.
+    Exits with an error if the consumer stops reading.
+    """
+    deadline = time.monotonic() + TIMEOUT
+    for i in range(count):
+        while not ring_buffer.put(i.to_bytes(8, "little")):
+            if time.monotonic() > deadline:
+                raise TimeoutError("Consumer stopped reading")
+
+    ring_buffer.flush()
+    ring_buffer.close()
+
+
+def produce_queue(ring_queue: spsc_ring_buffer.SpscQueue, first: int, count: int) -> None:
+    """
+    Puts the numbers first to first + count - 1 and then a sentinel.
+    """
+    for i in range(first, first + count):
+        ring_queue.put(i.to_bytes(8, "little"))
+
+    ring_queue.put(None)
+    ring_queue.ring_buffer.close()
+
+
+class TestSpscRingBuffer:
+    """
+    Single process and cross process behaviour.
+    """
+
+    def test_create_invalid(self) -> None:
+        """
+        Sizes must be positive.
+        """
+        result, ring_buffer = spsc_ring_buffer.SpscRingBuffer.create(0, SLOT_SIZE)
+
+        assert not result
+        assert ring_buffer is None
+
+    def test_empty(self, ring: spsc_ring_buffer.SpscRingBuffer) -> None:
+        """
+        Nothing to get from a new ring buffer.
+        """
+        assert ring.get() is None
+
+    def test_fifo_order(self, ring: spsc_ring_buffer.SpscRingBuffer) -> None:
+        """
+        Items of different lengths come out in the order they went in.
+        """
+        expected = [b"a", b"bc", b"", b"def"]
+
+        for item in expected:
+            assert ring.put(item)
+        actual = [ring.get() for _ in expected]
+
+        assert actual == expected
+        assert ring.get() is None
+
+    def test_full(self, ring: spsc_ring_buffer.SpscRingBuffer) -> None:
+        """
+        Put fails when every slot is used and succeeds again after a get.
+        """
+        for _ in range(CAPACITY):
+            assert ring.put(b"x")
+
+        assert not ring.put(b"y")
+        assert ring.get() == b"x"
+        assert ring.put(b"y")
+
+    def test_item_too_large(self, ring: spsc_ring_buffer.SpscRingBuffer) -> None:
+        """
+        Items larger than a slot are rejected.
+        """
+        assert not ring.put(bytes(SLOT_SIZE + 1))
+        assert ring.get() is None
+
+    def test_other_process(self, ring: spsc_ring_buffer.SpscRingBuffer) -> None:
+        """
+        Every item written by a producer process arrives once and in order.
+        """
+        count = 200
+        producer = mp.Process(target=produce, args=(ring, count))
+        producer.start()
+
+        actual = []
+        deadline = time.monotonic() + TIMEOUT
+        while len(actual) < count:
+            if time.monotonic() > deadline:
+                producer.terminate()
+                pytest.fail(f"Received {len(actual)} of {count} items before timing out")
+
+            data = ring.get()
+            if data is not None:
+                actual.append(int.from_bytes(data, "little"))
+
+        producer.join(TIMEOUT)
+
+        assert actual == list(range(count))
+        assert producer.exitcode == 0
+
+    def test_batched_puts(self) -> None:
+        """
+        Puts are only visible to the consumer once a batch fills or on flush().
+        """
+        result, ring_buffer = spsc_ring_buffer.SpscRingBuffer.create(
+            CAPACITY, SLOT_SIZE, BATCH_SIZE
+        )
+        assert result
+        assert ring_buffer is not None
+
+        try:
+            for item in [b"a", b"b"]:
+                assert ring_buffer.put(item)
+            assert ring_buffer.get() is None
+
+            assert ring_buffer.put(b"c")
+            assert [ring_buffer.get() for _ in range(3)] == [b"a", b"b", b"c"]
+
+            assert ring_buffer.put(b"d")
+            assert ring_buffer.get() is None
+            ring_buffer.flush()
+            assert ring_buffer.get() == b"d"
+        finally:
+            ring_buffer.close()
+            ring_buffer.unlink()
+
+    def test_batched_gets(self) -> None:
+        """
+        Gets only free their slots for the producer once a batch fills.
+        """
+        result, ring_buffer = spsc_ring_buffer.SpscRingBuffer.create(
+            CAPACITY, SLOT_SIZE, BATCH_SIZE
+        )
+        assert result
+        assert ring_buffer is not None
+
+        try:
+            for _ in range(CAPACITY):
+                assert ring_buffer.put(b"x")
+            ring_buffer.flush()
+
+            for _ in range(BATCH_SIZE - 1):
+                assert ring_buffer.get() == b"x"
+            assert not ring_buffer.put(b"y")
+
+            assert ring_buffer.get() == b"x"
+            assert ring_buffer.put(b"y")
+        finally:
+            ring_buffer.close()
+            ring_buffer.unlink()
+
+
+class TestSpscQueue:
+    """
+    Queue interface over the ring buffer.
+    """
+
+    def test_empty(self, ring: spsc_ring_buffer.SpscRingBuffer) -> None:
+        """
+        Get raises queue.Empty with nothing to get, blocking or not.
+        """
+        ring_queue = spsc_ring_buffer.SpscQueue(ring)
+
+        with pytest.raises(queue.Empty):
+            ring_queue.get_nowait()
+        with pytest.raises(queue.Empty):
+            ring_queue.get(timeout=0.01)
+
+    def test_full(self, ring: spsc_ring_buffer.SpscRingBuffer) -> None:
+        """
+        Put raises queue.Full when every slot is used, blocking or not.
+        """
+        ring_queue = spsc_ring_buffer.SpscQueue(ring)
+        for _ in range(CAPACITY):
+            ring_queue.put_nowait(b"x")
+
+        with pytest.raises(queue.Full):
+            ring_queue.put_nowait(b"y")
+        with pytest.raises(queue.Full):
+            ring_queue.put(b"y", timeout=0.01)
+
+    def test_sentinel(self, ring: spsc_ring_buffer.SpscRingBuffer) -> None:
+        """
+        None comes out as None.
+        """
+        ring_queue = spsc_ring_buffer.SpscQueue(ring)
+
+        ring_queue.put(b"a")
+        ring_queue.put(None)
+
+        assert ring_queue.get() == b"a"
+        assert ring_queue.get() is None
+
+    def test_item_too_large(self, ring: spsc_ring_buffer.SpscRingBuffer) -> None:
+        """
+        Items larger than a slot raise ValueError instead of waiting for space forever,
+        and nothing from the same call is put.
+        """
+        ring_queue = spsc_ring_buffer.SpscQueue(ring)
+
+        with pytest.raises(ValueError):
+            ring_queue.put(bytes(SLOT_SIZE + 1))
+        with pytest.raises(ValueError):
+            ring_queue.put_many([b"a", bytes(SLOT_SIZE + 1)], timeout=0.01)
+
+        with pytest.raises(queue.Empty):
+            ring_queue.get_nowait()
+
+    def test_multiple_producers(self, ring: spsc_ring_buffer.SpscRingBuffer) -> None:
+        """
+        Every item from every producer process arrives once and in order per producer.
+        """
+        count = 100
+        producer_count = 3
+        ring_queue = spsc_ring_buffer.MpscQueue(ring)
+        producers = [
+            mp.Process(target=produce_queue, args=(ring_queue, i * count, count))
+            for i in range(producer_count)
+        ]
+        for producer in producers:
+            producer.start()
+
+        actual = []
+        sentinel_count = 0
+        while sentinel_count < producer_count:
+            data = ring_queue.get(timeout=5.0)
+            if data is None:
+                sentinel_count += 1
+                continue
+
+            actual.append(int.from_bytes(data, "little"))
+
+        for producer in producers:
+            producer.join()
+
+        for i in range(producer_count):
+            expected = list(range(i * count, (i + 1) * count))
+            assert [value for value in actual if value in expected] == expected
+
+    def test_put_many(self, ring: spsc_ring_buffer.SpscRingBuffer) -> None:
+        """
+        Items put together come out in order, and only the ones that fit are put.
+        """
+        ring_queue = spsc_ring_buffer.SpscQueue(ring)
+
+        ring_queue.put_many([b"a", None])
+        with pytest.raises(queue.Full):
+            ring_queue.put_many([b"b", b"c", b"d"], False)
+
+        actual = [ring_queue.get_nowait() for _ in range(CAPACITY)]
+
+        assert actual == [b"a", None, b"b", b"c"]
+        with pytest.raises(queue.Empty):
+            ring_queue.get_nowait()
@@ -0,0 +1,77 @@
+"""
+Test the fixed size telemetry record.
+"""
+
+import dataclasses
+
+from modules.telemetry import telemetry
+
+
+FULL_DATA = telemetry.TelemetryData(
+    time_since_boot=123456,
+    x=1.5,
+    y=-2.25,
+    z=3.0,
+    x_velocity=0.5,
+    y_velocity=-0.75,
+    z_velocity=0.0,
+    roll=0.1,
+    pitch=-0.2,
+    yaw=3.14,
+    roll_speed=0.01,
+    pitch_speed=-0.02,
+    yaw_speed=0.03,
+)
+
+
+class TestTelemetryData:
+    """
+    Packing into a record and unpacking it again.
+    """
+
+    def test_record_size(self) -> None:
+        """
+        Every field is packed into the fixed size record.
+        """
+        record = FULL_DATA.pack()
+
+        assert len(record) == telemetry.TelemetryData.RECORD_SIZE
+        assert len(dataclasses.fields(telemetry.TelemetryData)) == 13
+
+    def test_round_trip(self) -> None:
+        """
+        Unpacking a packed record gives back an equal TelemetryData.
+        """
+        actual = telemetry.TelemetryData.unpack(FULL_DATA.pack())
+
+        assert actual == FULL_DATA
+
+    def test_time_since_boot_is_int(self) -> None:
+        """
+        The time since boot comes back as an int, not as the float it is stored as.
+        """
+        actual = telemetry.TelemetryData.unpack(FULL_DATA.pack())
+
+        assert isinstance(actual.time_since_boot, int)
+        assert actual.time_since_boot == FULL_DATA.time_since_boot
+
+    def test_none_fields(self) -> None:
+        """
+        Each field that is None comes back as None, with the other fields unchanged.
+        """
+        for field in dataclasses.fields(telemetry.TelemetryData):
+            expected = dataclasses.replace(FULL_DATA, **{field.name: None})
+
+            actual = telemetry.TelemetryData.unpack(expected.pack())
+
+            assert actual == expected
+
+    def test_default(self) -> None:
+        """
+        A TelemetryData with every field None round trips.
+        """
+        expected = telemetry.TelemetryData()
+
+        actual = telemetry.TelemetryData.unpack(expected.pack())
+
+        assert actual == expected
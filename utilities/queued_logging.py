@@ -0,0 +1,47 @@
+"""
+Moves log file writes off the calling thread.
+"""
+
+import atexit
+import logging.handlers
+import queue
+
+from modules.common.modules.logger import logger
+
+
+def start_queued_logging(
+    local_logger: logger.Logger,
+) -> "logging.handlers.QueueListener | None":
+    """
+    Replaces the handlers of the logger with a queue, which a background thread empties into the
+    original handlers. Logging calls then only format and enqueue the record, the background
+    thread does the file and console writes.
+
+    The listener is stopped at exit, which writes any records still in the queue.
+    Call this after forking worker processes, or stop and start the listener around a fork,
+    so the fork does not happen while its thread holds a lock.
+
+    local_logger: Existing logger from process.
+
+    Returns the listener, None if the logger has no handlers of its own to move.
+    """
+    underlying_logger = local_logger.logger
+    handlers = list(underlying_logger.handlers)
+    if len(handlers) == 0:
+        return None
+
+    record_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        record_queue,
+        *handlers,
+        respect_handler_level=True,
+    )
+
+    for handler in handlers:
+        underlying_logger.removeHandler(handler)
+    underlying_logger.addHandler(logging.handlers.QueueHandler(record_queue))
+
+    listener.start()
+    atexit.register(listener.stop)
+
+    return listener
@@ -2,26 +2,136 @@
 Queue.
 """
 
-import multiprocessing.managers
+import multiprocessing as mp
+import multiprocessing.connection
+import multiprocessing.queues
 import queue
 import time
 
+from utilities.workers import spsc_ring_buffer
+
 # pylint: disable=too-many-instance-attributes
 
 
 class QueueProxyWrapper:
     """
-    Wrapper for an underlying queue proxy which also stores `maxsize`.
+    Wrapper for an underlying queue which also stores `maxsize`.
 
     `maxsize <= 0` means infinite size.
+
+    The queue is a plain `multiprocessing.Queue` (pipe and lock, no manager server process
+    in between) unless an existing queue is passed in.
     """
 
     __QUEUE_TIMEOUT = 0.1  # seconds
     __QUEUE_DELAY = 0.1  # seconds
 
-    def __init__(self, mp_manager: multiprocessing.managers.SyncManager, maxsize: int = 0) -> None:
-        self.queue = mp_manager.Queue(maxsize)
+    def __init__(
+        self,
+        maxsize: int = 0,
+        backing_queue: multiprocessing.queues.Queue | spsc_ring_buffer.SpscQueue | None = None,
+    ) -> None:
+        """
+        maxsize: Maximum size of the queue.
+        backing_queue: Existing queue to wrap, `maxsize` should match it.
+        """
+        if backing_queue is None:
+            backing_queue = mp.Queue(maxsize)
+
+        self.queue = backing_queue
         self.maxsize = maxsize
+        # Becomes readable when an item is available, used to wait without polling
+        self.reader = getattr(backing_queue, "_reader", None)
+
+    @staticmethod
+    def wait_for_any(
+        queues: "list[QueueProxyWrapper]", timeout: float
+    ) -> "list[QueueProxyWrapper]":
+        """
+        Blocks until at least one of the queues has an item or the timeout expires.
+        If any queue has no pipe to wait on, the full timeout is slept instead.
+
+        queues: Queues to wait on.
+        timeout: Time waiting in seconds before giving up.
+
+        Returns the queues that may have an item, empty if the timeout expired.
+        All of the queues if any of them could not be waited on.
+        """
+        readers = [wrapper.reader for wrapper in queues]
+        if None in readers:
+            time.sleep(timeout)
+            return list(queues)
+
+        ready = multiprocessing.connection.wait(readers, timeout)
+        return [wrapper for wrapper, reader in zip(queues, readers) if reader in ready]
+
+    def get_many(self, max_messages: int, timeout: float = 0.0) -> list:
+        """
+        Gets up to `max_messages` items from the queue in one call.
+
+        max_messages: Maximum number of items to get.
+        timeout: Time waiting in seconds for the first item, 0 to not wait.
+
+        Returns the items in queue order, empty if there were none.
+        """
+        messages = []
+        try:
+            if timeout > 0.0:
+                messages.append(self.queue.get(timeout=timeout))
+
+            get_nowait = self.queue.get_nowait
+            append = messages.append
+            for _ in range(max_messages - len(messages)):
+                append(get_nowait())
+        except queue.Empty:
+            pass
+
+        return messages
+
+    def put_many(self, items: list, timeout: "float | None" = None) -> None:
+        """
+        Puts items in order with one call, which a ring buffer queue publishes together.
+
+        items: Items to put.
+        timeout: Time waiting in seconds for space, None to wait indefinitely.
+        """
+        if isinstance(self.queue, spsc_ring_buffer.SpscQueue):
+            self.queue.put_many(items, timeout=timeout)
+            return
+
+        put = self.queue.put
+        for item in items:
+            put(item, timeout=timeout)
+
+    def drain_until_sentinels(self, sentinel_count: int, timeout: float) -> list:
+        """
+        Gets items until `sentinel_count` sentinels (None) have been received,
+        for producers that put a sentinel as they exit.
+
+        sentinel_count: Number of producers.
+        timeout: Total time waiting in seconds before giving up on the remaining sentinels.
+
+        Returns the items received other than the sentinels.
+        """
+        items = []
+        deadline = time.monotonic() + timeout
+        while sentinel_count > 0:
+            remaining_time = deadline - time.monotonic()
+            if remaining_time <= 0.0:
+                break
+
+            try:
+                item = self.queue.get(timeout=remaining_time)
+            except queue.Empty:
+                break
+
+            if item is None:
+                sentinel_count -= 1
+                continue
+
+            items.append(item)
+
+        return items
 
     def fill_queue_with_sentinel(self, timeout: float = 0.0) -> None:
         """
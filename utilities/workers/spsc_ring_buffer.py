@@ -0,0 +1,337 @@
+"""
+Single producer single consumer ring buffer in shared memory.
+"""
+
+import multiprocessing.shared_memory
+import queue
+import struct
+import time
+
+
+# pylint: disable-next=too-many-instance-attributes
+class SpscRingBuffer:
+    """
+    Lock free ring buffer of fixed size byte slots, shared between exactly one producer process
+    and one consumer process.
+
+    Shared memory layout, with each counter on its own cache line to avoid false sharing:
+    [pad][head][pad][tail][pad][slot 0][slot 1]...
+
+    head is only written by the consumer and tail is only written by the producer.
+    Both are free running counters, the slot index is the counter modulo the capacity.
+    Each side keeps local copies of the counters and only publishes its own counter
+    every `batch_size` operations (or on `flush()`), which reduces cache line transfers.
+    """
+
+    __create_key = object()
+
+    CACHE_LINE_SIZE = 64  # bytes
+    __HEAD_OFFSET = CACHE_LINE_SIZE
+    __TAIL_OFFSET = 2 * CACHE_LINE_SIZE
+    __SLOTS_OFFSET = 3 * CACHE_LINE_SIZE
+    __LENGTH_FORMAT = "=I"
+    __LENGTH_SIZE = struct.calcsize(__LENGTH_FORMAT)
+
+    @classmethod
+    def create(
+        cls, capacity: int, slot_size: int, batch_size: int = 1
+    ) -> "tuple[bool, SpscRingBuffer | None]":
+        """
+        Allocates the ring buffer in new shared memory.
+
+        capacity: Number of slots.
+        slot_size: Maximum size of an item in bytes.
+        batch_size: Number of operations before a side publishes its counter.
+
+        Returns whether the ring buffer was created and the ring buffer.
+        """
+        if capacity <= 0 or slot_size <= 0 or batch_size <= 0:
+            return False, None
+
+        stride = cls.__LENGTH_SIZE + slot_size
+        try:
+            shared_memory = multiprocessing.shared_memory.SharedMemory(
+                create=True,
+                size=cls.__SLOTS_OFFSET + capacity * stride,
+            )
+        except OSError:
+            return False, None
+
+        # New shared memory is zero filled, so head and tail start at 0
+        return True, SpscRingBuffer(
+            cls.__create_key, shared_memory, capacity, slot_size, batch_size
+        )
+
+    def __init__(
+        self,
+        class_private_create_key: object,
+        shared_memory: multiprocessing.shared_memory.SharedMemory,
+        capacity: int,
+        slot_size: int,
+        batch_size: int,
+    ) -> None:
+        """
+        Private constructor, use create() method.
+        """
+        assert class_private_create_key is SpscRingBuffer.__create_key, "Use create() method"
+
+        self.capacity = capacity
+        self.slot_size = slot_size
+        self.__batch_size = batch_size
+        self.__shared_memory = shared_memory
+        self.__stride = self.__LENGTH_SIZE + slot_size
+
+        # Aligned 8 byte stores through a typed view are single writes
+        buffer = shared_memory.buf
+        self.__head = buffer[self.__HEAD_OFFSET : self.__HEAD_OFFSET + 8].cast("Q")
+        self.__tail = buffer[self.__TAIL_OFFSET : self.__TAIL_OFFSET + 8].cast("Q")
+        self.__data = buffer[self.__SLOTS_OFFSET :]
+
+        # Producer side
+        self.__local_tail = self.__tail[0]
+        self.__cached_head = self.__head[0]
+        self.__put_count = 0
+
+        # Consumer side
+        self.__local_head = self.__head[0]
+        self.__cached_tail = self.__tail[0]
+        self.__get_count = 0
+
+    @classmethod
+    def attach(cls, name: str, capacity: int, slot_size: int, batch_size: int) -> "SpscRingBuffer":
+        """
+        Attaches to the shared memory of an existing ring buffer.
+        Used when the ring buffer is pickled to another process.
+        """
+        shared_memory = multiprocessing.shared_memory.SharedMemory(name=name)
+        return SpscRingBuffer(cls.__create_key, shared_memory, capacity, slot_size, batch_size)
+
+    def __reduce__(self) -> "tuple":
+        """
+        Only the name of the shared memory is sent to other processes.
+        """
+        return SpscRingBuffer.attach, (
+            self.__shared_memory.name,
+            self.capacity,
+            self.slot_size,
+            self.__batch_size,
+        )
+
+    def put(self, data: bytes) -> bool:
+        """
+        Copies an item into the next free slot. Producer only.
+
+        data: Item, at most `slot_size` bytes.
+
+        Returns whether the item was written, False if the ring buffer is full.
+        """
+        if len(data) > self.slot_size:
+            return False
+
+        if self.__local_tail - self.__cached_head >= self.capacity:
+            # Only read the consumer's counter when the ring buffer looks full
+            self.__cached_head = self.__head[0]
+            if self.__local_tail - self.__cached_head >= self.capacity:
+                return False
+
+        offset = (self.__local_tail % self.capacity) * self.__stride
+        struct.pack_into(self.__LENGTH_FORMAT, self.__data, offset, len(data))
+        data_offset = offset + self.__LENGTH_SIZE
+        self.__data[data_offset : data_offset + len(data)] = data
+
+        self.__local_tail += 1
+        self.__put_count += 1
+        if self.__put_count >= self.__batch_size:
+            self.flush()
+
+        return True
+
+    def get(self) -> "bytes | None":
+        """
+        Copies the oldest item out of its slot. Consumer only.
+
+        Returns the item, None if the ring buffer is empty.
+        """
+        if self.__local_head == self.__cached_tail:
+            # Only read the producer's counter when the ring buffer looks empty
+            self.__cached_tail = self.__tail[0]
+            if self.__local_head == self.__cached_tail:
+                # Publish the consumed items so the producer can reuse their slots
+                self.__head[0] = self.__local_head
+                self.__get_count = 0
+                return None
+
+        offset = (self.__local_head % self.capacity) * self.__stride
+        (length,) = struct.unpack_from(self.__LENGTH_FORMAT, self.__data, offset)
+        data_offset = offset + self.__LENGTH_SIZE
+        data = bytes(self.__data[data_offset : data_offset + length])
+
+        self.__local_head += 1
+        self.__get_count += 1
+        if self.__get_count >= self.__batch_size:
+            self.__head[0] = self.__local_head
+            self.__get_count = 0
+
+        return data
+
+    def flush(self) -> None:
+        """
+        Publishes all written items to the consumer. Producer only.
+        """
+        self.__tail[0] = self.__local_tail
+        self.__put_count = 0
+
+    def reload_tail(self) -> None:
+        """
+        Takes the tail from shared memory, for producers that take turns under a lock.
+        Producer only.
+        """
+        self.__local_tail = self.__tail[0]
+        self.__put_count = 0
+
+    def flush_reads(self) -> None:
+        """
+        Publishes all read items so the producer can reuse their slots. Consumer only.
+        """
+        self.__head[0] = self.__local_head
+        self.__get_count = 0
+
+    def close(self) -> None:
+        """
+        Detaches this process from the shared memory. Every process using the ring buffer
+        should call this before exiting.
+        """
+        self.__head.release()
+        self.__tail.release()
+        self.__data.release()
+        self.__shared_memory.close()
+
+    def unlink(self) -> None:
+        """
+        Frees the shared memory once all processes have closed it. Call from the creator only.
+        """
+        self.__shared_memory.unlink()
+
+
+class SpscQueue:
+    """
+    Queue interface over SpscRingBuffer, so it can back a QueueProxyWrapper.
+    One producer process and one consumer process only.
+
+    Items are bytes. None can be put as a sentinel, so empty bytes cannot be sent.
+    A semaphore counts the published items, so a blocking get sleeps until an item is put
+    instead of polling. Free slots are not counted, so a blocking put polls the ring buffer
+    with a sleep that backs off up to `__MAX_POLL_PERIOD`.
+    """
+
+    __MIN_POLL_PERIOD = 0.0001  # seconds
+    __MAX_POLL_PERIOD = 0.01  # seconds
+
+    def __init__(self, ring_buffer: SpscRingBuffer) -> None:
+        self.ring_buffer = ring_buffer
+        self.__items = multiprocessing.Semaphore(0)
+
+    def _write(self, data_list: "list[bytes]") -> int:
+        """
+        Writes as many of the items as fit and publishes them together.
+
+        Returns the number of items written, fewer than given if the ring buffer filled up.
+        """
+        written_count = 0
+        for data in data_list:
+            if not self.ring_buffer.put(data):
+                break
+
+            written_count += 1
+
+        # The items must be visible to the consumer before they are counted
+        self.ring_buffer.flush()
+        return written_count
+
+    def put(self, item: "bytes | None", block: bool = True, timeout: "float | None" = None) -> None:
+        """
+        Puts an item, same semantics as `queue.Queue.put()`.
+        """
+        self.put_many([item], block, timeout)
+
+    def put_nowait(self, item: "bytes | None") -> None:
+        """
+        Puts an item without blocking, raises `queue.Full` if there is no space.
+        """
+        self.put_many([item], False)
+
+    def put_many(
+        self, items: "list[bytes | None]", block: bool = True, timeout: "float | None" = None
+    ) -> None:
+        """
+        Puts items in order, publishing each run of items that fits at once instead of one by one.
+        Raises `queue.Full` like `put()`, in which case only the items before the first one that
+        did not fit have been put.
+        Raises `ValueError` without putting anything if an item is larger than a slot, since it
+        would never fit.
+        """
+        data_list = [b"" if item is None else item for item in items]
+        slot_size = self.ring_buffer.slot_size
+        for data in data_list:
+            if len(data) > slot_size:
+                raise ValueError(
+                    f"Item of {len(data)} bytes is larger than the {slot_size} byte slot"
+                )
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        poll_period = self.__MIN_POLL_PERIOD
+        while True:
+            written_count = self._write(data_list)
+            for _ in range(written_count):
+                self.__items.release()
+
+            if written_count == len(data_list):
+                return
+
+            data_list = data_list[written_count:]
+            if not block or (deadline is not None and time.monotonic() >= deadline):
+                raise queue.Full
+
+            time.sleep(poll_period)
+            poll_period = min(poll_period * 2, self.__MAX_POLL_PERIOD)
+
+    def get(self, block: bool = True, timeout: "float | None" = None) -> "bytes | None":
+        """
+        Gets an item, same semantics as `queue.Queue.get()`.
+        """
+        if not self.__items.acquire(False):
+            # Free the slots already read, the producer may be waiting on them
+            self.ring_buffer.flush_reads()
+            if not block or not self.__items.acquire(True, timeout):
+                raise queue.Empty
+
+        # Counted items are always published, so this is never None
+        data = self.ring_buffer.get()
+        assert data is not None
+
+        if len(data) == 0:
+            return None
+
+        return data
+
+    def get_nowait(self) -> "bytes | None":
+        """
+        Gets an item without blocking, raises `queue.Empty` if there is none.
+        """
+        return self.get(False)
+
+
+class MpscQueue(SpscQueue):
+    """
+    SpscQueue that any number of producer processes can put into, one consumer process only.
+    Producers take turns writing under a lock, each continuing from the tail left by the last.
+    """
+
+    def __init__(self, ring_buffer: SpscRingBuffer) -> None:
+        super().__init__(ring_buffer)
+        self.__producer_lock = multiprocessing.Lock()
+
+    def _write(self, data_list: "list[bytes]") -> int:
+        with self.__producer_lock:
+            self.ring_buffer.reload_tail()
+            return super()._write(data_list)
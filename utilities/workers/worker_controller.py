@@ -3,7 +3,6 @@ For controlling workers.
 """
 
 import multiprocessing as mp
-import time
 
 
 class WorkerController:
@@ -12,15 +11,13 @@ class WorkerController:
     Contains exit and pause requests.
     """
 
-    __QUEUE_DELAY = 0.1  # seconds
-
     def __init__(self) -> None:
         """
-        Constructor creates internal queue and semaphore.
+        Constructor creates internal event and semaphore.
         """
         self.__pause = mp.BoundedSemaphore(1)
         self.__is_paused = False
-        self.__exit_queue = mp.Queue(1)
+        self.__exit_event = mp.Event()
 
     def request_pause(self) -> None:
         """
@@ -50,23 +47,28 @@ class WorkerController:
         Requests worker processes to exit.
         Does nothing if already requested.
         """
-        time.sleep(self.__QUEUE_DELAY)
-        if self.__exit_queue.empty():
-            self.__exit_queue.put(None)
+        self.__exit_event.set()
 
     def clear_exit(self) -> None:
         """
         Clears the exit request condition.
         Does nothing if already cleared.
         """
-        time.sleep(self.__QUEUE_DELAY)
-        if not self.__exit_queue.empty():
-            _ = self.__exit_queue.get()
+        self.__exit_event.clear()
 
     def is_exit_requested(self) -> bool:
         """
         Returns whether main has requested the worker process to exit.
-        There is a race condition, but it's fine because the worker process
-        will do at most 1 additional loop.
         """
-        return not self.__exit_queue.empty()
+        return self.__exit_event.is_set()
+
+    def wait_or_exit(self, timeout: float) -> bool:
+        """
+        Sleeps for the timeout, waking up early if main requests the worker process to exit.
+        Use instead of `time.sleep()` in worker loops so exit is not delayed.
+
+        timeout: Time waiting in seconds.
+
+        Returns whether main has requested the worker process to exit.
+        """
+        return self.__exit_event.wait(timeout)
@@ -3,6 +3,7 @@ For managing workers.
 """
 
 import multiprocessing as mp
+import time
 
 from modules.common.modules.logger import logger
 from utilities.workers import worker_controller
@@ -205,16 +206,40 @@ class WorkerManager:
         for worker in self.__workers:
             worker.start()
 
-    def join_workers(self) -> None:
+    def join_workers(self, timeout: "float | None" = None) -> None:
         """
         Join workers.
+
+        timeout: Total time waiting in seconds before terminating the workers still running,
+            None to wait indefinitely.
         """
+        deadline = None if timeout is None else time.monotonic() + timeout
         for worker in self.__workers:
-            worker.join()
+            if deadline is None:
+                worker.join()
+                continue
+
+            worker.join(max(deadline - time.monotonic(), 0.0))
+            if worker.is_alive():
+                target_and_worker_name = (
+                    f"{self.__worker_properties.get_target_name()} {worker.name}"
+                )
+                self.__local_logger.warning(
+                    f"Worker did not exit in time, terminating {target_and_worker_name}",
+                    True,
+                )
+                worker.terminate()
+                worker.join()
+
+    def are_workers_alive(self) -> bool:
+        """
+        Returns whether every worker is still running.
+        """
+        return all(worker.is_alive() for worker in self.__workers)
 
     def check_and_restart_dead_workers(self) -> bool:
         """
-        Check and restart dead workers.
+        Check and restart dead workers, including workers that exited to be recycled.
 
         Returns whether the dead workers were able to be restarted.
         """
@@ -224,12 +249,15 @@ class WorkerManager:
                 new_workers.append(worker)
                 continue
 
-            # Log dead worker
+            # Log dead worker, a clean exit is a worker recycling itself
             target_and_worker_name = f"{self.__worker_properties.get_target_name()} {worker.name}"
-            self.__local_logger.warning(
-                f"Worker died, restarting {target_and_worker_name}",
-                True,
-            )
+            if worker.exitcode == 0:
+                self.__local_logger.info(f"Recycling {target_and_worker_name}", True)
+            else:
+                self.__local_logger.warning(
+                    f"Worker died with exit code {worker.exitcode}, restarting {target_and_worker_name}",
+                    True,
+                )
 
             # Create a new worker
             result, new_worker = WorkerManager.__create_single_worker(
@@ -241,7 +269,8 @@ class WorkerManager:
                 self.__local_logger.error(f"Failed to restart {target_and_worker_name}", True)
                 return False
 
-            # Append the new worker
+            # Start and append the new worker
+            new_worker.start()
             new_workers.append(new_worker)
 
         self.__workers = new_workers